@@ -2,6 +2,8 @@
 from __future__ import annotations
 
 import difflib
+from bisect import bisect_right
+from itertools import accumulate
 from PyQt6 import QtGui
 
 
@@ -15,41 +17,179 @@ class DiffHighlighter(QtGui.QSyntaxHighlighter):
         color: QtGui.QColor | str | None = None,
     ) -> None:
         super().__init__(document)
+        # Kept so the highlighter can be detached and reattached.
+        self._doc = document
         self._base = base
+        self._base_lines = base.split("\n")
         self._diff_ranges: list[tuple[int, int]] = []
+        # End offsets of ``_diff_ranges``; the ranges are sorted and disjoint,
+        # so ``highlightBlock`` can bisect to the first one reaching a block.
+        self._range_ends: list[int] = []
+        # Text the current ranges were computed for, when known.
+        self._diffed_text: str | None = None
+        # Earliest position edited since the last diff; blocks from there on
+        # may have moved and are always rehighlighted.
+        self._dirty_from: int | None = None
         self._fmt = QtGui.QTextCharFormat()
         self.set_color(color or QtGui.QColor(255, 255, 0, 128))
+        document.contentsChange.connect(self._on_contents_change)
 
     def set_color(self, color: QtGui.QColor | str) -> None:
         if isinstance(color, str):
             color = QtGui.QColor(color)
         self._fmt.setBackground(color)
         self.rehighlight()
+        self._dirty_from = None
 
     def set_base(self, text: str) -> None:
         """Set baseline *text* for future comparisons."""
         self._base = text
+        self._base_lines = text.split("\n")
+        self._diffed_text = None
+        self._dirty_from = 0
         self.update_diff()
 
-    def update_diff(self) -> None:
-        """Recompute ranges of changed text and rehighlight."""
-        if not self._base:
-            self._diff_ranges = []
+    def update_diff(self, current: str | None = None) -> None:
+        """Recompute ranges of changed text and rehighlight affected blocks.
+
+        *current* may hold the document text when the caller already has it.
+        """
+        if self.document() is None:
+            return
+        old = self._diff_ranges
+        if self._base and current is None:
+            current = self.document().toPlainText()
+        if current is not None and current == self._diffed_text:
+            # Only formats changed (or nothing did); Qt already reformatted
+            # any touched blocks with the ranges that still apply.
+            self._dirty_from = None
+            return
+        self._diffed_text = current
+        ranges = self._ranges_for(current)
+        dirty_from = self._dirty_from
+        # Nothing was edited and the ranges are the same: formats are current.
+        if dirty_from is None and ranges == old:
+            return
+        self._set_ranges(ranges)
+        doc = self.document()
+        if dirty_from is None:
+            dirty_from = doc.characterCount()
+        if doc.findBlock(dirty_from) == doc.firstBlock():
             self.rehighlight()
+            self._dirty_from = None
             return
-        current = self.document().toPlainText()
-        matcher = difflib.SequenceMatcher(a=self._base, b=current)
-        self._diff_ranges = [
-            (j1, j2) for tag, _i1, _i2, j1, j2 in matcher.get_opcodes() if tag != "equal"
-        ]
-        self.rehighlight()
+        # Blocks before the first edit kept their position, so only those
+        # whose overlap with the diff ranges changed need new formats.
+        checked: set[int] = set()
+        for s, e in old + ranges:
+            block = doc.findBlock(s)
+            while block.isValid() and block.position() < min(e, dirty_from):
+                number = block.blockNumber()
+                if number not in checked:
+                    checked.add(number)
+                    start = block.position()
+                    end = start + block.length() - 1
+                    if _clip(old, start, end) != _clip(ranges, start, end):
+                        self.rehighlightBlock(block)
+                block = block.next()
+        block = doc.findBlock(dirty_from)
+        while block.isValid():
+            self.rehighlightBlock(block)
+            block = block.next()
+        self._dirty_from = None
+
+    def set_enabled(self, enabled: bool) -> None:
+        """Attach to or detach from the document.
+
+        While detached no diff is computed and the document keeps no diff
+        formats; reattaching recomputes the diff and rehighlights.
+        """
+        if enabled == (self.document() is not None):
+            return
+        self._diffed_text = None
+        if enabled:
+            self.setDocument(self._doc)
+            self._dirty_from = 0
+            self.update_diff()
+        else:
+            self.setDocument(None)
+            self._set_ranges([])
+
+    def replace_text(self, text: str) -> None:
+        """Replace the whole document with *text* as one undoable edit.
+
+        The diff ranges for *text* are computed before the edit, so the
+        blocks Qt reformats while applying it already get their final
+        formats and no separate rehighlight pass is needed afterwards.
+        Unlike ``setPlainText`` the document's undo history is kept.
+        """
+        if self.document() is not None:
+            self._set_ranges(self._ranges_for(text))
+            self._diffed_text = text
+        cursor = QtGui.QTextCursor(self._doc)
+        cursor.beginEditBlock()
+        cursor.select(QtGui.QTextCursor.SelectionType.Document)
+        cursor.insertText(text)
+        cursor.endEditBlock()
+        self._dirty_from = None
+
+    def _set_ranges(self, ranges: list[tuple[int, int]]) -> None:
+        self._diff_ranges = ranges
+        self._range_ends = [e for _s, e in ranges]
+
+    def _ranges_for(self, current: str | None) -> list[tuple[int, int]]:
+        # Text identical to the baseline (e.g. right after loading or undoing
+        # back to it) has no differences; skip the matcher entirely.
+        if not self._base or current == self._base:
+            return []
+        return _changed_ranges(self._base_lines, current)
+
+    def _on_contents_change(self, position: int, _removed: int, _added: int) -> None:
+        if self._dirty_from is None or position < self._dirty_from:
+            self._dirty_from = position
 
     # QSyntaxHighlighter API
     def highlightBlock(self, text: str) -> None:  # noqa: N802 (Qt API)
         start = self.currentBlock().position()
         end = start + len(text)
-        for s, e in self._diff_ranges:
-            if s < end and e > start:
-                left = max(s, start)
-                right = min(e, end)
-                self.setFormat(left - start, right - left, self._fmt)
+        ranges = self._diff_ranges
+        for i in range(bisect_right(self._range_ends, start), len(ranges)):
+            s, e = ranges[i]
+            if s >= end:
+                break
+            left = max(s, start)
+            right = min(e, end)
+            self.setFormat(left - start, right - left, self._fmt)
+
+
+def _changed_ranges(base_lines: list[str], current: str) -> list[tuple[int, int]]:
+    """Return the character ranges of *current* that differ from the base.
+
+    Lines are matched first, which only hashes and compares whole lines;
+    the character-level diff then runs on the changed groups of lines alone
+    instead of on the whole document.
+    """
+    lines = current.split("\n")
+    starts = [0, *accumulate(len(line) + 1 for line in lines)]
+    matcher = difflib.SequenceMatcher(a=base_lines, b=lines, autojunk=False)
+    ranges: list[tuple[int, int]] = []
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal" or j1 == j2:
+            continue
+        offset = starts[j1]
+        new = current[offset : starts[j2] - 1]
+        if tag == "insert":
+            ranges.append((offset, offset + len(new)))
+            continue
+        chars = difflib.SequenceMatcher(a="\n".join(base_lines[i1:i2]), b=new)
+        ranges.extend(
+            (offset + c1, offset + c2)
+            for op, _b1, _b2, c1, c2 in chars.get_opcodes()
+            if op != "equal" and c1 != c2
+        )
+    return ranges
+
+
+def _clip(ranges: list[tuple[int, int]], start: int, end: int) -> list[tuple[int, int]]:
+    """Return the parts of *ranges* that fall within ``[start, end)``."""
+    return [(max(s, start), min(e, end)) for s, e in ranges if s < end and e > start]
@@ -2,7 +2,9 @@ from __future__ import annotations
 
 """Model-backed glossary table for efficient editing and persistence."""
 
-from typing import List, Tuple
+import logging
+from dataclasses import replace
+from typing import List
 
 from PyQt6 import QtCore
 
@@ -15,19 +17,31 @@ class GlossaryTableModel(QtCore.QAbstractTableModel):
     The model proxies a :class:`~app.services.glossary.Glossary` instance and
     persists changes to disk.  It is optimised for large numbers of rows by
     using Qt's model/view architecture and only creating items on demand.
+    Edits update the glossary in memory at once; a snapshot is written to
+    disk on a background thread once editing pauses (see :meth:`flush`).
     """
 
     def __init__(self, glossary: Glossary | None = None, parent=None) -> None:
         super().__init__(parent)
         self._glossary: Glossary | None = None
-        self._rows: List[Tuple[str, str]] = []
+        # Sources and targets are kept in parallel lists.
+        self._src: List[str] = []
+        self._dst: List[str] = []
+        self._save_timer = QtCore.QTimer(self)
+        self._save_timer.setInterval(500)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.timeout.connect(self._write_pending)
+        self._pending_save = False
+        # A single thread keeps snapshot writes in submission order.
+        self._save_pool = QtCore.QThreadPool(self)
+        self._save_pool.setMaxThreadCount(1)
         if glossary is not None:
             self.set_glossary(glossary)
 
     # ------------------------------------------------------------------
     # Qt model API
     def rowCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:  # noqa: D401
-        return len(self._rows)
+        return len(self._src)
 
     def columnCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:  # noqa: D401
         return 2
@@ -38,11 +52,11 @@ class GlossaryTableModel(QtCore.QAbstractTableModel):
         return ["Source", "Target"][section]
 
     def data(self, index: QtCore.QModelIndex, role: int = QtCore.Qt.ItemDataRole.DisplayRole):  # noqa: D401
-        if not index.isValid() or index.row() >= len(self._rows):
+        if not index.isValid() or index.row() >= len(self._src):
             return None
-        src, dst = self._rows[index.row()]
         if role in (QtCore.Qt.ItemDataRole.DisplayRole, QtCore.Qt.ItemDataRole.EditRole):
-            return src if index.column() == 0 else dst
+            column = self._src if index.column() == 0 else self._dst
+            return column[index.row()]
         return None
 
     def flags(self, index: QtCore.QModelIndex):  # noqa: D401
@@ -57,37 +71,34 @@ class GlossaryTableModel(QtCore.QAbstractTableModel):
     def setData(self, index: QtCore.QModelIndex, value, role: int = QtCore.Qt.ItemDataRole.EditRole):  # noqa: D401
         if role != QtCore.Qt.ItemDataRole.EditRole or not index.isValid():
             return False
-        row, col = index.row(), index.column()
-        src, dst = self._rows[row]
-        text = str(value).strip()
-        if col == 0:
-            src = text
-        else:
-            dst = text
-        self._rows[row] = (src, dst)
+        row = index.row()
+        column = self._src if index.column() == 0 else self._dst
+        column[row] = str(value).strip()
+        src, dst = self._src[row], self._dst[row]
         if self._glossary is not None and src:
             self._glossary.add(src, dst)
-            self._glossary.save()
+            self.schedule_save()
         self.dataChanged.emit(index, index, [role])
         return True
 
     def insertRows(self, row: int, count: int, parent: QtCore.QModelIndex = QtCore.QModelIndex()):
         self.beginInsertRows(parent, row, row + count - 1)
-        for _ in range(count):
-            self._rows.insert(row, ("", ""))
+        self._src[row:row] = [""] * count
+        self._dst[row:row] = [""] * count
         self.endInsertRows()
         return True
 
     def removeRows(self, row: int, count: int, parent: QtCore.QModelIndex = QtCore.QModelIndex()):
         self.beginRemoveRows(parent, row, row + count - 1)
-        removed = self._rows[row : row + count]
-        del self._rows[row : row + count]
+        removed = self._src[row : row + count]
+        del self._src[row : row + count]
+        del self._dst[row : row + count]
         self.endRemoveRows()
         if self._glossary is not None:
-            for src, _ in removed:
+            for src in removed:
                 if src:
                     self._glossary.remove(src)
-            self._glossary.save()
+            self.schedule_save()
         return True
 
     # ------------------------------------------------------------------
@@ -95,22 +106,48 @@ class GlossaryTableModel(QtCore.QAbstractTableModel):
     def set_glossary(self, glossary: Glossary | None) -> None:
         """Populate the model from *glossary* entries."""
 
+        self._write_pending()
         self.beginResetModel()
         self._glossary = glossary
-        if glossary is not None:
-            self._rows = [(src, dst) for src, dst in glossary.entries.items()]
-        else:
-            self._rows = []
+        entries = glossary.entries if glossary is not None else {}
+        self._src = list(entries)
+        self._dst = list(entries.values())
         self.endResetModel()
 
+    def schedule_save(self) -> None:
+        """Write the current glossary once edits pause."""
+
+        self._pending_save = True
+        self._save_timer.start()
+
+    def flush(self) -> None:
+        """Write pending edits and wait until every queued write finished."""
+
+        self._write_pending()
+        self._save_pool.waitForDone()
+
+    def _write_pending(self) -> None:
+        self._save_timer.stop()
+        if self._pending_save and self._glossary is not None:
+            snapshot = replace(self._glossary, entries=dict(self._glossary.entries))
+            self._save_pool.start(lambda: _save_glossary(snapshot))
+        self._pending_save = False
+
     def add_pair(self) -> None:
-        self.insertRows(len(self._rows), 1)
+        self.insertRows(len(self._src), 1)
 
     def remove_pair(self, row: int) -> None:
-        if 0 <= row < len(self._rows):
+        if 0 <= row < len(self._src):
             self.removeRows(row, 1)
 
     def glossary_entries(self) -> dict[str, str]:
         if self._glossary is not None:
             return dict(self._glossary.entries)
-        return {src: dst for src, dst in self._rows if src}
+        return {src: dst for src, dst in zip(self._src, self._dst) if src}
+
+
+def _save_glossary(glossary: Glossary) -> None:
+    try:
+        glossary.save()
+    except OSError:  # pragma: no cover - disk errors
+        logging.exception("Failed to save glossary %s", glossary.file)
@@ -22,7 +22,6 @@ from .default_icon import ensure_empty_project_icon
 
 ensure_empty_project_icon()
 
-from .models import get_translator, _MODELS
 from .services.files import (
     append_stat,
     enqueue_chapters,
@@ -36,8 +35,9 @@ from .services.project import ProjectManager
 from .services.cloud import list_documents, load_document
 from .services.reports import save_csv, save_html
 from .services.versioning import check_for_updates, pull_updates
-from .services.workers import DEFAULT_RATE_LIMITER, ModelWorker
+from .services.workers import DEFAULT_RATE_LIMITER, ModelWorker, prewarm_thread_pool
 from .ui_main import Ui_MainWindow
+from .models import TRANSLATORS, get_translator
 from .settings import AppSettings
 
 
@@ -56,13 +56,8 @@ class MainController:
             Path(self.settings.translation_path or self.settings.original_path or "project").stem
         )
         self.project = self.project_manager.load(project_id, title=project_id)
-        base = Path(
-            self.settings.translation_path
-            or self.settings.original_path
-            or "."
-        )
-        base.mkdir(parents=True, exist_ok=True)
-        self.stats_path = base / "stats.json"
+        self.settings.base_path.mkdir(parents=True, exist_ok=True)
+        self.stats_path = self.settings.stats_path
         self.stats = load_stats(self.stats_path)
 
         self._init_ui()
@@ -93,7 +88,7 @@ class MainController:
         # model selection and saving
         models = [
             name
-            for name in sorted(_MODELS.keys())
+            for name in sorted(TRANSLATORS)
             if getattr(self.settings, f"{name}_key", "")
         ]
         self.ui.model_combo.clear()
@@ -164,6 +159,7 @@ class MainController:
                 return
         else:
             text = load_docx(chapter)
+        self.ui.cancel_history_restore()
         self.ui.original_edit.setPlainText(text)
         self.ui.translation_edit.clear()
         self.ui.reset_timer()
@@ -317,7 +313,7 @@ class MainController:
         self.stats = append_stat(stat, self.stats_path)
         self.project_manager.add_chapter(self.project, name, text)
         self.ui.reset_timer()
-        self.ui.version_manager.flush()
+        self.ui.flush_versions()
         if self.settings.auto_next:
             self.next_chapter()
 
@@ -348,6 +344,7 @@ class MainController:
 
 def main() -> None:
     app = QtWidgets.QApplication(sys.argv)
+    prewarm_thread_pool()
     repo_root = Path(__file__).resolve().parent.parent
     if check_for_updates(repo_root):
         success, message = pull_updates(repo_root)
@@ -361,7 +358,9 @@ def main() -> None:
     ui.setupUi(window, settings)
     controller = MainController(window, ui, settings)
     app.aboutToQuit.connect(settings.save)
-    app.aboutToQuit.connect(ui.version_manager.flush)
+    app.aboutToQuit.connect(settings.flush)
+    app.aboutToQuit.connect(ui.flush_versions)
+    app.aboutToQuit.connect(ui.glossary_model.flush)
     window.show()
     sys.exit(app.exec())
 
@@ -1,39 +1,63 @@
-"""Helpers for obtaining translator classes and related utilities."""
+"""Helpers for obtaining translator classes and related utilities.
+
+Translator modules are imported on first use, so importing this package does
+not load every model client.
+"""
 
 from __future__ import annotations
 
-from typing import Any, Dict, Type
+from functools import lru_cache
+from typing import Any, Dict, Tuple, Type
 
 from ..settings import AppSettings
 
-from .deepl import DeepLTranslator
-from .gemini import GeminiTranslator
-from .grok import GrokTranslator
-from .qwen import QwenTranslator
-
 
 TranslatorType = Type[Any]
 
 
-_MODELS: Dict[str, TranslatorType] = {
-    "deepl": DeepLTranslator,
-    "gemini": GeminiTranslator,
-    "grok": GrokTranslator,
-    "qwen": QwenTranslator,
+# Supported models as ``name -> (translator class, display name)``.  The class
+# lives in ``app.models.<name>``; the settings dialog builds its key rows and
+# model list from this table in this order.
+TRANSLATORS: Dict[str, Tuple[str, str]] = {
+    "gemini": ("GeminiTranslator", "Gemini"),
+    "deepl": ("DeepLTranslator", "DeepL"),
+    "grok": ("GrokTranslator", "Grok"),
+    "qwen": ("QwenTranslator", "Qwen"),
 }
 
 
-def get_translator(name: str, settings: AppSettings | None = None):
-    """Return a translator instance for *name* using the appropriate key.
+@lru_cache(maxsize=None)
+def translator_class(name: str) -> TranslatorType:
+    """Import and return the translator class for model *name*.
 
     The lookup is case-insensitive. ``ValueError`` is raised for unknown
     names.
     """
 
-    cls = _MODELS.get(name.lower())
-    if not cls:
+    name = name.lower()
+    if name not in TRANSLATORS:
         raise ValueError(f"Unknown model: {name}")
+    # Plain relative imports, one per model, so PyInstaller can still find
+    # the modules while they load lazily.
+    if name == "gemini":
+        from . import gemini as module
+    elif name == "deepl":
+        from . import deepl as module
+    elif name == "grok":
+        from . import grok as module
+    else:
+        from . import qwen as module
+    return getattr(module, TRANSLATORS[name][0])
+
+
+def get_translator(name: str, settings: AppSettings | None = None):
+    """Return a translator instance for *name* using the appropriate key.
+
+    The lookup is case-insensitive. ``ValueError`` is raised for unknown
+    names.
+    """
 
+    cls = translator_class(name)
     settings = settings or AppSettings.load()
     key = getattr(settings, f"{name.lower()}_key", "")
     try:
@@ -26,6 +26,8 @@ class ProjectManager:
         self.root.mkdir(parents=True, exist_ok=True)
         self.path = self.root / "projects.json"
         self.projects: list[Project] = []
+        # Projects by id for :meth:`get`; kept in step with ``projects``.
+        self._by_id: dict[str, Project] = {}
         self.load()
 
     # ------------------------------------------------------------------
@@ -38,6 +40,7 @@ class ProjectManager:
             self.projects = [Project(**item) for item in data]
         else:
             self.projects = []
+        self._by_id = {p.id: p for p in self.projects}
 
     # ------------------------------------------------------------------
     def save(self) -> None:
@@ -50,24 +53,21 @@ class ProjectManager:
     def get(self, project_id: str) -> Project | None:
         """Return project by ``project_id`` or ``None``."""
 
-        for proj in self.projects:
-            if proj.id == project_id:
-                return proj
-        return None
+        return self._by_id.get(project_id)
 
     # ------------------------------------------------------------------
     def create(self, name: str) -> Project:
         """Create a new project with ``name``."""
 
         base_id = "".join(c if c.isalnum() else "_" for c in name).lower() or "project"
-        existing = {p.id for p in self.projects}
         candidate = base_id
         counter = 1
-        while candidate in existing:
+        while candidate in self._by_id:
             counter += 1
             candidate = f"{base_id}_{counter}"
         project = Project(id=candidate, name=name)
         self.projects.append(project)
+        self._by_id[candidate] = project
         self.save()
         return project
 
@@ -94,4 +94,5 @@ class ProjectManager:
         """Delete project by ``project_id``."""
 
         self.projects = [p for p in self.projects if p.id != project_id]
+        self._by_id.pop(project_id, None)
         self.save()
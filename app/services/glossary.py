@@ -12,6 +12,7 @@ from pathlib import Path
 from typing import Dict
 import csv
 import json
+import os
 
 
 @dataclass
@@ -53,9 +54,12 @@ class Glossary:
             "entries": self.entries,
             "auto_to_prompt": self.auto_to_prompt,
         }
-        file_path.write_text(
+        # Written to a temporary file first so readers never see a partial file.
+        tmp_path = file_path.with_name(file_path.name + ".tmp")
+        tmp_path.write_text(
             json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8"
         )
+        os.replace(tmp_path, file_path)
         self.file = file_path
 
     @classmethod
@@ -74,10 +78,24 @@ class Glossary:
 
 
 def list_glossaries(folder: Path | str) -> list[Path]:
-    """Return all glossary JSON files in *folder*."""
+    """Return all glossary JSON files in *folder* sorted by name.
+
+    The directory is read with a single :func:`os.scandir` pass whose entry
+    types come from the listing itself, so no file is ``stat``-ed. A missing
+    *folder* yields an empty list.
+    """
 
     root = Path(folder)
-    return sorted(root.glob("*.json"))
+    try:
+        with os.scandir(root) as entries:
+            names = sorted(
+                entry.name
+                for entry in entries
+                if entry.name.endswith(".json") and entry.is_file()
+            )
+    except FileNotFoundError:
+        return []
+    return [root / name for name in names]
 
 
 def create_glossary(name: str, folder: Path | str) -> Glossary:
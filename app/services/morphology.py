@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 import re
+from bisect import bisect_left
 from dataclasses import dataclass
-from typing import List
+from operator import attrgetter
+from typing import List, Tuple
 from PyQt6 import QtGui
 
 
@@ -62,6 +64,14 @@ class MorphologyService:
         return errors
 
 
+class _BlockErrors(QtGui.QTextBlockUserData):
+    """Error spans last applied to a block, relative to its start."""
+
+    def __init__(self, spans: List[Tuple[int, int]]) -> None:
+        super().__init__()
+        self.spans = spans
+
+
 class MorphologyHighlighter(QtGui.QSyntaxHighlighter):
     """Underline morphology errors using :class:`MorphologyService`."""
 
@@ -69,24 +79,52 @@ class MorphologyHighlighter(QtGui.QSyntaxHighlighter):
         super().__init__(document)
         self._service = service
         self.errors: List[MorphologyError] = []
+        # Start offsets of ``errors`` (sorted) and the longest error, used to
+        # find the errors overlapping a block without scanning all of them.
+        self._starts: List[int] = []
+        self._max_length = 0
         self._fmt = QtGui.QTextCharFormat()
         self._fmt.setUnderlineStyle(QtGui.QTextCharFormat.UnderlineStyle.SpellCheckUnderline)
         self._fmt.setUnderlineColor(QtGui.QColor("red"))
 
     def update_errors(self) -> None:
-        """Reanalyse document text and rehighlight."""
-        text = self.document().toPlainText()
-        self.errors = self._service.analyze(text)
-        self.rehighlight()
+        """Reanalyse document text and rehighlight the blocks that changed.
 
-    # QSyntaxHighlighter API
-    def highlightBlock(self, text: str) -> None:  # noqa: N802
-        start = self.currentBlock().position()
-        end = start + len(text)
-        for err in self.errors:
+        Each block remembers the spans it was last formatted with, so blocks
+        whose errors merely moved along with the text are left alone.
+        """
+        doc = self.document()
+        text = doc.toPlainText()
+        self.errors = sorted(self._service.analyze(text), key=attrgetter("start"))
+        self._starts = [err.start for err in self.errors]
+        self._max_length = max((err.length for err in self.errors), default=0)
+        block = doc.firstBlock()
+        while block.isValid():
+            start = block.position()
+            data = block.userData()
+            applied = data.spans if isinstance(data, _BlockErrors) else []
+            if self._spans(start, start + block.length() - 1) != applied:
+                self.rehighlightBlock(block)
+            block = block.next()
+
+    def _spans(self, start: int, end: int) -> List[Tuple[int, int]]:
+        """Return ``(offset, length)`` of the errors within ``[start, end)``."""
+        spans: List[Tuple[int, int]] = []
+        lo = bisect_left(self._starts, start - self._max_length)
+        hi = bisect_left(self._starts, end)
+        for err in self.errors[lo:hi]:
             err_start = err.start
             err_end = err.start + err.length
             if err_start < end and err_end > start:
                 left = max(err_start, start)
                 right = min(err_end, end)
-                self.setFormat(left - start, right - left, self._fmt)
+                spans.append((left - start, right - left))
+        return spans
+
+    # QSyntaxHighlighter API
+    def highlightBlock(self, text: str) -> None:  # noqa: N802
+        start = self.currentBlock().position()
+        spans = self._spans(start, start + len(text))
+        for offset, length in spans:
+            self.setFormat(offset, length, self._fmt)
+        self.setCurrentBlockUserData(_BlockErrors(spans) if spans else None)
@@ -2,45 +2,87 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import InitVar, dataclass, field
 from datetime import datetime
 import subprocess
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import Any, Callable, Dict, List
 
 from .files import load_versions, save_versions
 
 
 @dataclass
 class VersionManager:
-    """Keep track of translation revisions and persist them to disk."""
+    """Keep track of translation revisions and persist them to disk.
+
+    Only the first revision is stored in full; every later one records the
+    edit from its predecessor as ``pos``, ``removed`` and ``added`` so memory
+    and file size grow with the changes rather than the document length.
+    Histories saved with a full ``text`` per revision are converted on load.
+
+    Pass ``load=False`` to use *versions* already read from *path*.
+    """
 
     path: Path
     versions: List[Dict[str, Any]] = field(default_factory=list)
     index: int = -1
+    _text: str = field(default="", init=False, repr=False)
     _dirty: bool = field(default=False, init=False)
-
-    def __post_init__(self) -> None:
-        self.versions = load_versions(self.path)
+    load: InitVar[bool] = True
+
+    def __post_init__(self, load: bool) -> None:
+        if load:
+            self.versions = load_versions(self.path)
+        text = ""
+        for i, entry in enumerate(self.versions):
+            if "text" not in entry:
+                text = _apply_patch(text, entry)
+            elif i:
+                new = entry.pop("text")
+                entry.update(_make_patch(text, new))
+                text = new
+                self._dirty = True
+            else:
+                text = entry["text"]
+        self._text = text
         if self.versions:
             self.index = len(self.versions) - 1
 
+    @property
+    def text(self) -> str:
+        """Text of the current revision."""
+
+        return self._text
+
+    @property
+    def base_text(self) -> str:
+        """Text of the first recorded revision."""
+
+        return self.versions[0]["text"] if self.versions else ""
+
     def add_version(self, text: str) -> None:
         """Append *text* as a new revision if it differs from current."""
 
-        if self.index >= 0 and self.versions[self.index]["text"] == text:
+        if self.index >= 0 and self._text == text:
             return
         del self.versions[self.index + 1 :]
-        self.versions.append({"timestamp": datetime.utcnow().isoformat(), "text": text})
+        entry: Dict[str, Any] = {"timestamp": datetime.utcnow().isoformat()}
+        if self.versions:
+            entry.update(_make_patch(self._text, text))
+        else:
+            entry["text"] = text
+        self.versions.append(entry)
         self.index = len(self.versions) - 1
+        self._text = text
         self._dirty = True
 
     def undo(self) -> str | None:
         """Step back in history and return the previous text."""
 
         if self.index > 0:
+            self._text = _revert_patch(self._text, self.versions[self.index])
             self.index -= 1
-            return self.versions[self.index]["text"]
+            return self._text
         return None
 
     def redo(self) -> str | None:
@@ -48,7 +90,8 @@ class VersionManager:
 
         if self.index < len(self.versions) - 1:
             self.index += 1
-            return self.versions[self.index]["text"]
+            self._text = _apply_patch(self._text, self.versions[self.index])
+            return self._text
         return None
 
     def flush(self) -> None:
@@ -59,6 +102,49 @@ class VersionManager:
         self._dirty = False
 
 
+def _make_patch(old: str, new: str) -> Dict[str, Any]:
+    """Return the single replacement turning *old* into *new*."""
+
+    limit = min(len(old), len(new))
+    prefix = _common_length(limit, lambda n: old[:n] == new[:n])
+    limit -= prefix
+    suffix = _common_length(
+        limit, lambda n: old[len(old) - n :] == new[len(new) - n :]
+    )
+    return {
+        "pos": prefix,
+        "removed": old[prefix : len(old) - suffix],
+        "added": new[prefix : len(new) - suffix],
+    }
+
+
+def _common_length(limit: int, matches: Callable[[int], bool]) -> int:
+    """Return the largest ``n <= limit`` for which ``matches(n)`` holds.
+
+    Slice comparisons run in C, so a binary search over them is much faster
+    than walking both strings character by character in Python.
+    """
+
+    lo, hi = 0, limit
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if matches(mid):
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
+def _apply_patch(text: str, entry: Dict[str, Any]) -> str:
+    pos = entry["pos"]
+    return text[:pos] + entry["added"] + text[pos + len(entry["removed"]) :]
+
+
+def _revert_patch(text: str, entry: Dict[str, Any]) -> str:
+    pos = entry["pos"]
+    return text[:pos] + entry["removed"] + text[pos + len(entry["added"]) :]
+
+
 def check_for_updates(repo_path: Path) -> bool:
     """Return ``True`` if *repo_path* has updates available."""
 
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from typing import Any, Callable
 
+import hashlib
+import json
 import threading
 import time
 
@@ -29,8 +31,45 @@ class RateLimiter:
             self.last_call = time.perf_counter()
 
 
-class Worker(QtCore.QThread):
-    """Generic worker executing a callable in a ``QThread``."""
+class _Runnable(QtCore.QRunnable):
+    """Adapter running *target* on a :class:`QtCore.QThreadPool` thread."""
+
+    def __init__(self, target: Callable[[], None]) -> None:
+        super().__init__()
+        self._target = target
+
+    def run(self) -> None:  # type: ignore[override]
+        self._target()
+
+
+def prewarm_thread_pool(count: int = 2) -> None:
+    """Spawn *count* idle threads in the global thread pool.
+
+    Qt creates pool threads on demand, so the first background task pays
+    for thread creation.  Running *count* no-op tasks that wait for each
+    other forces distinct threads to be started ahead of time.  The pool's
+    expiry timeout is left alone, so threads that stay idle are still
+    reclaimed after Qt's default 30 seconds.
+    """
+
+    pool = QtCore.QThreadPool.globalInstance()
+    count = min(count, pool.maxThreadCount())
+    if count <= 0:
+        return
+    barrier = threading.Barrier(count)
+
+    def _wait() -> None:
+        try:
+            barrier.wait(timeout=1.0)
+        except threading.BrokenBarrierError:
+            pass
+
+    for _ in range(count):
+        pool.start(_Runnable(_wait))
+
+
+class Worker(QtCore.QObject):
+    """Generic worker executing a callable on the global ``QThreadPool``."""
 
     finished = QtCore.pyqtSignal(object)
     error = QtCore.pyqtSignal(Exception)
@@ -48,19 +87,87 @@ class Worker(QtCore.QThread):
         self.kwargs = kwargs
         self.rate_limiter = rate_limiter
 
-    def run(self) -> None:  # type: ignore[override]
+    def start(self) -> None:
+        """Schedule :meth:`run` on the global thread pool."""
+
+        QtCore.QThreadPool.globalInstance().start(_Runnable(self.run))
+
+    def run(self) -> None:
         try:
-            if self.rate_limiter is not None:
-                self.rate_limiter.wait()
-            result = self.func(*self.args, **self.kwargs)
+            result = self._call()
         except Exception as exc:  # pragma: no cover - network/IO safety
             self.error.emit(exc)
         else:
             self.finished.emit(result)
 
+    def _call(self) -> Any:
+        if self.rate_limiter is not None:
+            self.rate_limiter.wait()
+        return self.func(*self.args, **self.kwargs)
+
+
+class _InFlight:
+    """Result slot shared by workers submitting identical requests."""
+
+    __slots__ = ("event", "result", "error")
+
+    def __init__(self) -> None:
+        self.event = threading.Event()
+        self.result: Any = None
+        self.error: Exception | None = None
+
+
+_IN_FLIGHT: dict[bytes, _InFlight] = {}
+_IN_FLIGHT_LOCK = threading.Lock()
+
+
+def _request_key(model: Any, text: str, kwargs: dict[str, Any]) -> bytes:
+    """Return a short digest identifying a translation request."""
+
+    digest = hashlib.blake2b(digest_size=8)
+    digest.update(type(model).__qualname__.encode("utf-8"))
+    digest.update(str(getattr(model, "model", "")).encode("utf-8"))
+    digest.update(text.encode("utf-8"))
+    digest.update(
+        json.dumps(kwargs, sort_keys=True, ensure_ascii=False, default=str).encode("utf-8")
+    )
+    return digest.digest()
+
+
+def _coalesce(key: bytes, call: Callable[[], Any]) -> Any:
+    """Run *call* once for concurrent requests sharing *key*.
+
+    The first caller performs the request; callers arriving while it is in
+    flight wait for and reuse its result or exception.
+    """
+
+    with _IN_FLIGHT_LOCK:
+        slot = _IN_FLIGHT.get(key)
+        owner = slot is None
+        if owner:
+            slot = _IN_FLIGHT[key] = _InFlight()
+    if not owner:
+        slot.event.wait()
+        if slot.error is not None:
+            raise slot.error
+        return slot.result
+    try:
+        slot.result = call()
+    except Exception as exc:
+        slot.error = exc
+        raise
+    finally:
+        with _IN_FLIGHT_LOCK:
+            del _IN_FLIGHT[key]
+        slot.event.set()
+
 
 class ModelWorker(Worker):
-    """Worker executing ``model.translate`` in the background."""
+    """Worker executing ``model.translate`` in the background.
+
+    Identical requests (same model, text, prompt and glossary) submitted
+    while one is still running share a single backend call.
+    """
 
     def __init__(
         self,
@@ -70,6 +177,10 @@ class ModelWorker(Worker):
         **kwargs: Any,
     ) -> None:
         super().__init__(model.translate, text, rate_limiter=rate_limiter, **kwargs)
+        self.key = _request_key(model, text, kwargs)
+
+    def _call(self) -> Any:
+        return _coalesce(self.key, super()._call)
 
 
 # Default limiter allowing one request per second
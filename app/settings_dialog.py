@@ -0,0 +1,621 @@
+"""Dialog for editing application settings."""
+
+from __future__ import annotations
+
+import os
+import re
+from functools import lru_cache, partial
+from pathlib import Path
+from typing import Any, Callable
+
+from PyQt6 import QtCore, QtGui, QtWidgets
+
+from . import styles
+from .models import TRANSLATORS, translator_class
+from .services.files import load_stats, save_stats
+from .services.glossary import Glossary
+from .services.workers import Worker
+from .settings import AppSettings
+
+# Settings read by :func:`styles.init`; it only needs rerunning when one changed.
+_STYLE_KEYS = frozenset(
+    {"app_background", "accent_color", "text_color", "header_font", "base_font"}
+)
+
+# Syntactic check for proxy URLs, run before any network request is made.
+_PROXY_RE = re.compile(r"^(?:https?|socks5h?)://[^\s/$.?#][^\s]*$", re.IGNORECASE)
+
+# Colour settings edited as ``#rrggbb`` text with a picker button, in dialog order.
+_COLOR_FIELDS = (
+    ("app_background", "Фон приложения"),
+    ("accent_color", "Акцентный цвет"),
+    ("text_color", "Цвет текста"),
+)
+
+
+# Totals ``(characters, seconds, chapters)`` per stats file with its mtime.
+_STATS_CACHE: dict[Path, tuple[int, tuple[int, int, int]]] = {}
+
+
+def _stats_totals(path: Path) -> tuple[int, int, int]:
+    """Return aggregated statistics from *path*, reparsed only when it changes."""
+
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        return 0, 0, 0
+    cached = _STATS_CACHE.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    stats = load_stats(path)
+    total_chars = total_time = 0
+    for entry in stats:
+        total_chars += entry.get("characters", 0)
+        total_time += entry.get("time", 0)
+    totals = (total_chars, total_time, len(stats))
+    _STATS_CACHE[path] = (mtime, totals)
+    return totals
+
+
+@lru_cache(maxsize=256)
+def _glossary_pair_count(path: str, mtime: int) -> int:
+    """Return the number of entries in the glossary at *path*.
+
+    *mtime* is part of the cache key so edited files are parsed again.
+    """
+
+    try:
+        return len(Glossary.load(path).entries)
+    except Exception:
+        return 0
+
+
+def _glossary_pairs(folder: Path) -> int:
+    """Return the total number of word pairs in all glossaries in *folder*."""
+
+    try:
+        it = os.scandir(folder)
+    except OSError:
+        return 0
+    total = 0
+    with it:
+        for entry in it:
+            name = entry.name
+            if name.startswith(".") or not name.endswith(".json") or not entry.is_file():
+                continue
+            total += _glossary_pair_count(entry.path, entry.stat().st_mtime_ns)
+    return total
+
+
+def _hex_to_qcolor(value: str) -> QtGui.QColor:
+    """Return a colour for ``#RRGGBB``/``#AARRGGBB`` *value*.
+
+    Other spellings (colour names, ``#RGB``) fall back to Qt's parser.
+    """
+
+    if value.startswith("#") and len(value) in (7, 9):
+        try:
+            rgb = int(value[1:], 16)
+        except ValueError:
+            pass
+        else:
+            if len(value) == 9:
+                return QtGui.QColor.fromRgba(rgb)
+            return QtGui.QColor.fromRgb(rgb)
+    return QtGui.QColor(value)
+
+
+def _argb_hex(color: QtGui.QColor) -> str:
+    """Return *color* as ``#aarrggbb``, like ``name(NameFormat.HexArgb)``."""
+
+    return f"#{color.rgba():08x}"
+
+
+def _hsv_name(hue: int, value: int) -> str:
+    """Return ``#rrggbb`` for a fully saturated colour.
+
+    Mirrors ``QColor.fromHsv(hue, 255, value).name()``, including Qt's
+    16-bit intermediate precision, without creating a ``QColor``.
+    """
+
+    sector, frac = divmod(hue % 360 / 60, 1)
+    v = value / 255
+    q = v * (1 - frac)
+    t = v * frac
+    rgb = (
+        (v, t, 0.0),
+        (q, v, 0.0),
+        (0.0, v, t),
+        (0.0, q, v),
+        (t, 0.0, v),
+        (v, 0.0, q),
+    )[int(sector)]
+    return "#" + "".join(f"{int(c * 0xFFFF + 0.5) >> 8:02x}" for c in rgb)
+
+
+@lru_cache(maxsize=128)
+def _neon_qss(hue: int, intensity: int, width: int) -> tuple[str, str]:
+    """Return the neon colour name and preview stylesheet for the given values."""
+
+    name = _hsv_name(hue, min(255, intensity * 5))
+    return name, f"background-color: {name}; border: {width}px solid {name}"
+
+
+class SettingsDialog(QtWidgets.QDialog):
+    """Dialog allowing the user to edit application settings."""
+
+    def __init__(self, settings: AppSettings, parent: QtWidgets.QWidget | None = None):
+        super().__init__(parent)
+        self.setWindowTitle("Настройки")
+        self.settings = settings
+        self._color = _hex_to_qcolor(settings.highlight_color)
+        self._neon_color = _hex_to_qcolor(settings.neon_color)
+        self._stats_path = settings.stats_path
+        self._glossary_folder = settings.glossary_folder
+
+        main_layout = QtWidgets.QVBoxLayout(self)
+        tabs = QtWidgets.QTabWidget()
+        main_layout.addWidget(tabs)
+
+        settings_widget = QtWidgets.QWidget()
+        layout = QtWidgets.QFormLayout(settings_widget)
+
+        # Original folder selector
+        orig_layout = QtWidgets.QHBoxLayout()
+        self.original_edit = QtWidgets.QLineEdit(settings.original_path)
+        orig_btn = QtWidgets.QPushButton("...")
+        orig_btn.clicked.connect(lambda: self._choose_folder(self.original_edit))
+        orig_layout.addWidget(self.original_edit)
+        orig_layout.addWidget(orig_btn)
+
+        # Translation folder selector
+        trans_layout = QtWidgets.QHBoxLayout()
+        self.translation_edit = QtWidgets.QLineEdit(settings.translation_path)
+        trans_btn = QtWidgets.QPushButton("...")
+        trans_btn.clicked.connect(lambda: self._choose_folder(self.translation_edit))
+        trans_layout.addWidget(self.translation_edit)
+        trans_layout.addWidget(trans_btn)
+
+        # Projects folder selector
+        projects_layout = QtWidgets.QHBoxLayout()
+        self.projects_edit = QtWidgets.QLineEdit(settings.projects_dir)
+        projects_btn = QtWidgets.QPushButton("...")
+        projects_btn.clicked.connect(lambda: self._choose_folder(self.projects_edit))
+        projects_layout.addWidget(self.projects_edit)
+        projects_layout.addWidget(projects_btn)
+
+        self.use_proxy_box = QtWidgets.QCheckBox(
+            "Использовать прокси", objectName="use_proxy"
+        )
+        self.use_proxy_box.setChecked(settings.use_proxy)
+        self.use_proxy_box.toggled.connect(self._on_proxy_toggle)
+
+        self.proxy_url_edit = QtWidgets.QLineEdit(
+            settings.proxy_url, objectName="proxy_url"
+        )
+        self.proxy_check_btn = QtWidgets.QPushButton("Проверить")
+        self.proxy_check_btn.clicked.connect(self._test_proxy)
+        self._on_proxy_toggle(self.use_proxy_box.isChecked())
+
+        self.gdoc_token_edit = QtWidgets.QLineEdit(settings.gdoc_token)
+        self.gdoc_folder_edit = QtWidgets.QLineEdit(settings.gdoc_folder_id)
+
+        icon = self.style().standardIcon(
+            QtWidgets.QStyle.StandardPixmap.SP_DialogApplyButton
+        )
+        self._key_edits: dict[str, QtWidgets.QLineEdit] = {}
+        self._key_labels: dict[str, QtWidgets.QLabel] = {}
+        self._verified_key: dict[str, str] = {}
+        self._key_valid: dict[str, bool] = {}
+        # Background checks in flight, kept referenced until they report back.
+        self._workers: dict[str, Worker] = {}
+        # Set once the dialog is closed; checks finishing later must not touch
+        # its widgets, which are deleted with it.
+        self._closed = False
+        self._accepted = False
+
+        for name, (_cls_name, title) in TRANSLATORS.items():
+            key = getattr(settings, f"{name}_key")
+            valid = getattr(settings, f"{name}_key_valid")
+            self._verified_key[name] = key if valid else ""
+            self._key_valid[name] = valid
+            edit = self._key_edits[name] = QtWidgets.QLineEdit(key)
+            label = QtWidgets.QLabel()
+            label.setPixmap(icon.pixmap(16, 16))
+            if self._key_valid[name]:
+                label.show()
+            else:
+                label.hide()
+            edit.textChanged.connect(partial(self._on_key_changed, name))
+            edit.editingFinished.connect(partial(self._verify_key, name))
+            layout_row = QtWidgets.QHBoxLayout()
+            layout_row.addWidget(edit)
+            layout_row.addWidget(label)
+            layout.addRow(f"Ключ {title}", layout_row)
+            self._key_labels[name] = label
+
+        self.model_combo = QtWidgets.QComboBox()
+        self.model_combo.addItems(list(TRANSLATORS))
+        if settings.model:
+            index = self.model_combo.findText(settings.model)
+            if index != -1:
+                self.model_combo.setCurrentIndex(index)
+
+        self.synonym_combo = QtWidgets.QComboBox()
+        self.synonym_combo.addItems(["datamuse", "model"])
+        index = self.synonym_combo.findText(settings.synonym_provider)
+        if index != -1:
+            self.synonym_combo.setCurrentIndex(index)
+
+        self.machine_check_box = QtWidgets.QCheckBox()
+        self.machine_check_box.setChecked(settings.machine_check)
+
+        self.auto_next_box = QtWidgets.QCheckBox()
+        self.auto_next_box.setChecked(settings.auto_next)
+
+        self.format_combo = QtWidgets.QComboBox()
+        self.format_combo.addItems(["docx", "txt"])
+        index = self.format_combo.findText(settings.format)
+        if index != -1:
+            self.format_combo.setCurrentIndex(index)
+
+        self.chapter_template_edit = QtWidgets.QLineEdit(settings.chapter_template)
+
+        # Stylesheet changes are applied at most once per frame (~16 ms)
+        # instead of on every keystroke or slider step.
+        self._style_pending: dict[QtWidgets.QWidget, str] = {}
+        self._style_timer = QtCore.QTimer(self)
+        self._style_timer.setSingleShot(True)
+        self._style_timer.setInterval(16)
+        self._style_timer.timeout.connect(self._flush_styles)
+
+        self._color_edits: dict[str, QtWidgets.QLineEdit] = {}
+        self._color_btns: dict[str, QtWidgets.QPushButton] = {}
+        color_rows = [
+            (label, self._make_color_row(key, getattr(settings, key)))
+            for key, label in _COLOR_FIELDS
+        ]
+
+        self.color_btn = QtWidgets.QPushButton()
+        self._update_color_btn()
+        self.color_btn.clicked.connect(self._choose_color)
+        self.neon_color_slider = QtWidgets.QSlider(QtCore.Qt.Orientation.Horizontal)
+        self.neon_color_slider.setRange(0, 359)
+        hue = self._neon_color.hue()
+        self.neon_color_slider.setValue(0 if hue == -1 else hue)
+
+        self.neon_intensity_slider = QtWidgets.QSlider(QtCore.Qt.Orientation.Horizontal)
+        self.neon_intensity_slider.setRange(1, 50)
+        self.neon_intensity_slider.setValue(settings.neon_intensity)
+
+        self.neon_width_spin = QtWidgets.QSpinBox()
+        self.neon_width_spin.setRange(1, 50)
+        self.neon_width_spin.setValue(settings.neon_width)
+        self.neon_width_spin.setSuffix(" px")
+
+        self.neon_preview = QtWidgets.QFrame()
+        self.neon_preview.setFixedSize(40, 20)
+        self.neon_preview.setFrameShape(QtWidgets.QFrame.Shape.Box)
+        self.neon_color_slider.valueChanged.connect(self._update_neon_preview)
+        self.neon_intensity_slider.valueChanged.connect(self._update_neon_preview)
+        self.neon_width_spin.valueChanged.connect(self._update_neon_preview)
+        self._update_neon_preview()
+
+        layout.addRow("Папка оригинала", orig_layout)
+        layout.addRow("Папка перевода", trans_layout)
+        layout.addRow("Папка проектов", projects_layout)
+        layout.addRow(self.use_proxy_box)
+        proxy_layout = QtWidgets.QHBoxLayout()
+        proxy_layout.addWidget(self.proxy_url_edit)
+        proxy_layout.addWidget(self.proxy_check_btn)
+        layout.addRow("URL прокси", proxy_layout)
+        layout.addRow("Токен Google Docs", self.gdoc_token_edit)
+        layout.addRow("ID папки Google Docs", self.gdoc_folder_edit)
+        layout.addRow("Модель", self.model_combo)
+        layout.addRow("Провайдер синонимов", self.synonym_combo)
+        layout.addRow("Формат", self.format_combo)
+        layout.addRow("Машинная проверка", self.machine_check_box)
+        layout.addRow("Следующая глава", self.auto_next_box)
+        for label, row in color_rows:
+            layout.addRow(label, row)
+
+        self.header_font_combo = QtWidgets.QFontComboBox()
+        self.header_font_combo.setCurrentFont(QtGui.QFont(settings.header_font))
+        layout.addRow("Шрифт заголовков", self.header_font_combo)
+
+        self.base_font_combo = QtWidgets.QFontComboBox()
+        self.base_font_combo.setCurrentFont(QtGui.QFont(settings.base_font))
+        layout.addRow("Базовый шрифт", self.base_font_combo)
+
+        self.font_size_spin = QtWidgets.QSpinBox()
+        self.font_size_spin.setRange(6, 48)
+        self.font_size_spin.setValue(settings.font_size)
+        layout.addRow("Размер шрифта", self.font_size_spin)
+        layout.addRow("Цвет подсветки", self.color_btn)
+        layout.addRow("Цвет свечения", self.neon_color_slider)
+        layout.addRow("Интенсивность свечения", self.neon_intensity_slider)
+        layout.addRow("Ширина свечения", self.neon_width_spin)
+        layout.addRow("Предпросмотр свечения", self.neon_preview)
+        layout.addRow("Шаблон главы", self.chapter_template_edit)
+
+        tabs.addTab(settings_widget, "Общие")
+
+        # The statistics tab reads stats.json and every glossary, so it is
+        # only filled in the first time the user opens it.
+        self._stats_widget = QtWidgets.QWidget()
+        self._stats_built = False
+        self._stats_index = tabs.addTab(self._stats_widget, "Статистика")
+        tabs.currentChanged.connect(self._on_tab_changed)
+
+        # Settings attribute and the getter reading it back, applied in accept().
+        self._bindings: list[tuple[str, Callable[[], Any]]] = [
+            ("original_path", self.original_edit.text),
+            ("translation_path", self.translation_edit.text),
+            ("projects_dir", self.projects_edit.text),
+            ("gdoc_token", self.gdoc_token_edit.text),
+            ("gdoc_folder_id", self.gdoc_folder_edit.text),
+            ("use_proxy", self.use_proxy_box.isChecked),
+            ("proxy_url", self.proxy_url_edit.text),
+            ("model", self.model_combo.currentText),
+            ("synonym_provider", self.synonym_combo.currentText),
+            ("machine_check", self.machine_check_box.isChecked),
+            ("auto_next", self.auto_next_box.isChecked),
+            ("format", self.format_combo.currentText),
+            ("header_font", lambda: self.header_font_combo.currentFont().family()),
+            ("base_font", lambda: self.base_font_combo.currentFont().family()),
+            ("highlight_color", lambda: _argb_hex(self._color)),
+            ("neon_color", lambda: self._current_neon()[0]),
+            ("neon_intensity", self.neon_intensity_slider.value),
+            ("neon_width", self.neon_width_spin.value),
+            ("font_size", self.font_size_spin.value),
+            ("chapter_template", self.chapter_template_edit.text),
+        ]
+        for name, edit in self._key_edits.items():
+            self._bindings.append((f"{name}_key", edit.text))
+            self._bindings.append((f"{name}_key_valid", partial(self._key_is_valid, name)))
+        self._bindings.extend((key, edit.text) for key, edit in self._color_edits.items())
+
+        buttons = QtWidgets.QDialogButtonBox(
+            QtWidgets.QDialogButtonBox.StandardButton.Ok
+            | QtWidgets.QDialogButtonBox.StandardButton.Cancel,
+        )
+        buttons.accepted.connect(self.accept)
+        buttons.rejected.connect(self.reject)
+        main_layout.addWidget(buttons)
+
+    # --- internal helpers --------------------------------------------
+    def _on_tab_changed(self, index: int) -> None:
+        if self._stats_built or index != self._stats_index:
+            return
+        self._build_stats_tab()
+        self._refresh_stats()
+
+    def _build_stats_tab(self) -> None:
+        stats_layout = QtWidgets.QFormLayout(self._stats_widget)
+        self.stats_chars = QtWidgets.QLabel("0")
+        self.stats_chapters = QtWidgets.QLabel("0")
+        self.stats_time = QtWidgets.QLabel("00:00:00")
+        self.stats_pairs = QtWidgets.QLabel("0")
+        reset_btn = QtWidgets.QPushButton("Сбросить статистику")
+        reset_btn.clicked.connect(self._reset_stats)
+        stats_layout.addRow("Переведённых символов", self.stats_chars)
+        stats_layout.addRow("Глав", self.stats_chapters)
+        stats_layout.addRow("Общее время", self.stats_time)
+        stats_layout.addRow("Пар слов", self.stats_pairs)
+        stats_layout.addRow(reset_btn)
+        self._stats_built = True
+
+    def _refresh_stats(self) -> None:
+        total_chars, total_time, chapters = _stats_totals(self._stats_path)
+        hours, remainder = divmod(total_time, 3600)
+        minutes, seconds = divmod(remainder, 60)
+        self.stats_chars.setText(str(total_chars))
+        self.stats_chapters.setText(str(chapters))
+        self.stats_time.setText(f"{hours:02d}:{minutes:02d}:{seconds:02d}")
+        self.stats_pairs.setText(str(_glossary_pairs(self._glossary_folder)))
+
+    def _reset_stats(self) -> None:
+        save_stats([], self._stats_path)
+        self._refresh_stats()
+
+    def _on_key_changed(self, name: str, _text: str = "") -> None:
+        """Reset cached verification when a key edit is modified."""
+        label = self._key_labels[name]
+        text = self._key_edits[name].text()
+        if text == self._verified_key.get(name, ""):
+            if self._key_valid[name]:
+                label.show()
+            else:
+                label.hide()
+            return
+        label.hide()
+        self._key_valid[name] = False
+        self._verified_key[name] = ""
+
+    def _key_is_valid(self, name: str) -> bool:
+        """Return whether the key currently entered for *name* was verified."""
+        return (
+            self._key_valid[name]
+            and self._verified_key[name] == self._key_edits[name].text().strip()
+        )
+
+    def _verify_key(self, name: str) -> None:
+        """Perform a test request to validate an API key."""
+        edit = self._key_edits[name]
+        label = self._key_labels[name]
+        key = edit.text().strip()
+        if key == self._verified_key.get(name, ""):
+            if self._key_valid[name]:
+                label.show()
+            else:
+                label.hide()
+            return
+        if not key:
+            label.hide()
+            self._key_valid[name] = False
+            self._verified_key[name] = ""
+            return
+        # Remember the key being checked so repeated editingFinished signals
+        # don't start another request and stale results can be discarded.
+        # Until the check reports back the key counts as unverified.
+        label.hide()
+        self._verified_key[name] = key
+        self._key_valid[name] = False
+        worker = Worker(self._ping_translator, name, key)
+        worker.finished.connect(
+            lambda _result, n=name, k=key: self._on_verify_done(n, k, True)
+        )
+        worker.error.connect(
+            lambda _exc, n=name, k=key: self._on_verify_done(n, k, False)
+        )
+        self._workers[name] = worker
+        worker.start()
+
+    def _ping_translator(self, name: str, key: str) -> None:
+        """Send a test request with *key*; runs on a worker thread."""
+        translator_class(name)(key, settings=self.settings).translate("ping")
+
+    def _on_verify_done(self, name: str, key: str, success: bool) -> None:
+        if self._verified_key.get(name) != key:
+            return
+        self._workers.pop(name, None)
+        if self._closed:
+            # ``accept`` left the validity of a pending key alone; record the
+            # result now if that key was saved.
+            if self._accepted and getattr(self.settings, f"{name}_key").strip() == key:
+                setattr(self.settings, f"{name}_key_valid", success)
+                self.settings.save()
+            return
+        if success:
+            self._key_labels[name].show()
+        else:
+            self._key_labels[name].hide()
+        self._key_valid[name] = success
+
+    def _choose_folder(self, line_edit: QtWidgets.QLineEdit) -> None:
+        path = QtWidgets.QFileDialog.getExistingDirectory(
+            self, "Выбор папки", line_edit.text()
+        )
+        if path and Path(path) != Path(line_edit.text()):
+            line_edit.setText(path)
+
+    def _choose_color(self) -> None:
+        color = QtWidgets.QColorDialog.getColor(self._color, self)
+        if color.isValid():
+            self._color = color
+            self._update_color_btn()
+
+    def _make_color_row(self, key: str, initial: str) -> QtWidgets.QHBoxLayout:
+        """Create the line edit and swatch button editing colour *key*."""
+        edit = QtWidgets.QLineEdit(initial)
+        btn = QtWidgets.QPushButton()
+        btn.setStyleSheet(f"background-color: {initial}")
+        btn.clicked.connect(partial(self._pick_color, key))
+        edit.textChanged.connect(partial(self._sync_color_btn, key))
+        self._color_edits[key] = edit
+        self._color_btns[key] = btn
+        row = QtWidgets.QHBoxLayout()
+        row.addWidget(edit)
+        row.addWidget(btn)
+        return row
+
+    def _sync_color_btn(self, key: str, _text: str = "") -> None:
+        self._queue_style(
+            self._color_btns[key], f"background-color: {self._color_edits[key].text()}"
+        )
+
+    def _queue_style(self, widget: QtWidgets.QWidget, qss: str) -> None:
+        self._style_pending[widget] = qss
+        # Not restarted while running, so a long drag still refreshes.
+        if not self._style_timer.isActive():
+            self._style_timer.start()
+
+    def _flush_styles(self) -> None:
+        for widget, qss in self._style_pending.items():
+            widget.setStyleSheet(qss)
+        self._style_pending.clear()
+
+    def _pick_color(self, key: str, _checked: bool = False) -> None:
+        edit = self._color_edits[key]
+        color = QtWidgets.QColorDialog.getColor(_hex_to_qcolor(edit.text()), self)
+        if color.isValid():
+            edit.setText(color.name())
+
+    def _on_proxy_toggle(self, checked: bool) -> None:
+        self.proxy_url_edit.setEnabled(checked)
+        self.proxy_check_btn.setEnabled(checked)
+
+    def _test_proxy(self) -> None:
+        import requests
+
+        url = self.proxy_url_edit.text().strip()
+        if not url:
+            QtWidgets.QMessageBox.warning(
+                self, "Проверка прокси", "Укажите URL прокси"
+            )
+            return
+        if not _PROXY_RE.match(url):
+            QtWidgets.QMessageBox.warning(
+                self, "Проверка прокси", "Некорректный URL прокси"
+            )
+            return
+        proxies = {"http": url, "https": url}
+        self.proxy_check_btn.setEnabled(False)
+        worker = Worker(
+            requests.get, "https://httpbin.org/get", proxies=proxies, timeout=5
+        )
+        worker.finished.connect(self._on_proxy_ok)
+        worker.error.connect(self._on_proxy_error)
+        self._workers["proxy"] = worker
+        worker.start()
+
+    def _on_proxy_ok(self, _response: object) -> None:  # pragma: no cover - network
+        self._workers.pop("proxy", None)
+        self.proxy_check_btn.setEnabled(self.use_proxy_box.isChecked())
+        QtWidgets.QMessageBox.information(self, "Проверка прокси", "Прокси работает")
+
+    def _on_proxy_error(self, exc: Exception) -> None:  # pragma: no cover - network
+        self._workers.pop("proxy", None)
+        self.proxy_check_btn.setEnabled(self.use_proxy_box.isChecked())
+        QtWidgets.QMessageBox.critical(
+            self, "Проверка прокси", f"Не удалось подключиться: {exc}"
+        )
+
+    def _current_neon(self) -> tuple[str, str]:
+        return _neon_qss(
+            self.neon_color_slider.value(),
+            self.neon_intensity_slider.value(),
+            self.neon_width_spin.value(),
+        )
+
+    def _update_neon_preview(self) -> None:
+        self._queue_style(self.neon_preview, self._current_neon()[1])
+
+    def _update_color_btn(self) -> None:
+        self.color_btn.setStyleSheet(
+            f"background-color: {_argb_hex(self._color)}"
+        )
+
+    # --- Qt overrides ------------------------------------------------
+    def accept(self) -> None:  # type: ignore[override]
+        # Keys still being checked keep their stored validity; the result is
+        # written by ``_on_verify_done`` once the check finishes.
+        pending = {
+            f"{name}_key_valid"
+            for name in self._workers
+            if self._verified_key[name] == self._key_edits[name].text().strip()
+            and getattr(self.settings, f"{name}_key").strip() == self._verified_key[name]
+        }
+        with self.settings.hold_flush():
+            for attr, getter in self._bindings:
+                if attr not in pending:
+                    setattr(self.settings, attr, getter())
+            if self.settings.changed_fields() & _STYLE_KEYS:
+                styles.init(self.settings)
+        self._accepted = True
+        super().accept()
+
+    def done(self, result: int) -> None:  # type: ignore[override]
+        self._closed = True
+        super().done(result)
+
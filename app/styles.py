@@ -2,12 +2,11 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 import logging
 
-from PyQt6 import QtGui
-
 # Color palette (dark theme)
 APP_BACKGROUND = "#212121"
 FIELD_BACKGROUND = "#303030"
@@ -21,24 +20,48 @@ HEADER_FONT = "Cattedrale"
 
 # Directory containing bundled font files
 FONT_DIR = Path(__file__).resolve().parent.parent / "assets" / "fonts"
-
-
+_INTER_FONT_PATH = str(FONT_DIR / "Inter-VariableFont_opsz,wght.ttf")
+_HEADER_FONT_PATH = str(FONT_DIR / "Cattedrale[RUSbypenka220]-Regular.ttf")
+
+# Set once the bundled fonts have been registered by :func:`init`.
+_fonts_registered = False
+
+
+# Widgets highlighted on focus/hover, joined once for the QSS rules below.
+_FOCUS_HOVER_SELECTORS = ",\n".join((
+    "QTextEdit:focus",
+    "QTextEdit:hover",
+    "QPlainTextEdit:focus",
+    "QPlainTextEdit:hover",
+    "QLineEdit:focus",
+    "QLineEdit:hover",
+    "QPushButton:focus",
+    "QPushButton:hover",
+    "QTableView#glossary:focus",
+    "QTableView#glossary:hover",
+))
+_NEON_GLOW_SELECTORS = ",\n".join((
+    "QTextEdit:focus",
+    "QTextEdit:hover",
+    "QPlainTextEdit:focus",
+    "QPlainTextEdit:hover",
+    "QLineEdit:focus",
+    "QLineEdit:hover",
+    "QTableView#glossary:focus",
+    "QTableView#glossary:hover",
+    "QPushButton:hover",
+    "QPushButton:focus",
+))
+
+
+@lru_cache(maxsize=32)
 def focus_hover_rule(color: str) -> str:
     """Return a QSS snippet highlighting widgets on focus/hover."""
 
-    selectors = [
-        "QTextEdit:focus",
-        "QTextEdit:hover",
-        "QLineEdit:focus",
-        "QLineEdit:hover",
-        "QPushButton:focus",
-        "QPushButton:hover",
-        "QTableView#glossary:focus",
-        "QTableView#glossary:hover",
-    ]
-    return ",\n".join(selectors) + f" {{\n    border: 1px solid {color};\n}}"
+    return f"{_FOCUS_HOVER_SELECTORS} {{\n    border: 1px solid {color};\n}}"
 
 
+@lru_cache(maxsize=32)
 def neon_glow_rule(color: str, intensity: int, width: int) -> str:
     """Return a QSS snippet that highlights widgets on focus/hover.
 
@@ -58,57 +81,56 @@ def neon_glow_rule(color: str, intensity: int, width: int) -> str:
 
     # ``intensity`` is kept for backward compatibility; only ``width``
     # influences the resulting border thickness at the moment.
-    selectors = [
-        "QTextEdit:focus",
-        "QTextEdit:hover",
-        "QLineEdit:focus",
-        "QLineEdit:hover",
-        "QTableView#glossary:focus",
-        "QTableView#glossary:hover",
-    ]
-    selectors.extend([
-        "QPushButton:hover",
-        "QPushButton:focus",
-    ])
-    return ",\n".join(selectors) + f" {{\n    border: {width}px solid {color};\n}}"
-
-
-def _register_font(filename: str) -> str | None:
-    """Register *filename* from :data:`FONT_DIR` and return its family.
+    return f"{_NEON_GLOW_SELECTORS} {{\n    border: {width}px solid {color};\n}}"
+
+
+def _register_font(path: str) -> str | None:
+    """Register the font file at *path* and return its family.
 
     If the font cannot be loaded, a warning is logged and ``None`` is
     returned so the caller can fall back to system fonts.
     """
 
-    font_id = QtGui.QFontDatabase.addApplicationFont(str(FONT_DIR / filename))
+    from PyQt6 import QtGui
+
+    font_id = QtGui.QFontDatabase.addApplicationFont(path)
     if font_id == -1:
-        logging.warning("Failed to load %s; falling back to system fonts", filename)
+        logging.warning("Failed to load %s; falling back to system fonts", path)
         return None
 
     families = QtGui.QFontDatabase.applicationFontFamilies(font_id)
     if families:
         return families[0]
 
-    logging.warning("Font %s registered but no families found; using system fonts", filename)
+    logging.warning("Font %s registered but no families found; using system fonts", path)
     return None
 
 
 def init(settings: Any | None = None) -> None:
-    """Load bundled fonts and apply user-selected colours."""
+    """Load bundled fonts and apply user-selected colours.
 
-    global APP_BACKGROUND, ACCENT_COLOR, TEXT_COLOR, INTER_FONT, HEADER_FONT
+    Fonts are registered on the first call only; later calls just apply
+    *settings*.
+    """
 
-    # Register bundled fonts so they are available in font pickers
-    if family := _register_font("Inter-VariableFont_opsz,wght.ttf"):
-        INTER_FONT = family
-    else:
-        INTER_FONT = QtGui.QFont().defaultFamily()
-
-    header_family = _register_font("Cattedrale[RUSbypenka220]-Regular.ttf")
-    if header_family:
-        HEADER_FONT = header_family
-    else:
-        HEADER_FONT = QtGui.QFont().defaultFamily()
+    global APP_BACKGROUND, ACCENT_COLOR, TEXT_COLOR, INTER_FONT, HEADER_FONT
+    global _fonts_registered
+
+    if not _fonts_registered:
+        from PyQt6 import QtGui
+
+        # Register bundled fonts so they are available in font pickers
+        if family := _register_font(_INTER_FONT_PATH):
+            INTER_FONT = family
+        else:
+            INTER_FONT = QtGui.QFont().defaultFamily()
+
+        header_family = _register_font(_HEADER_FONT_PATH)
+        if header_family:
+            HEADER_FONT = header_family
+        else:
+            HEADER_FONT = QtGui.QFont().defaultFamily()
+        _fonts_registered = True
 
     if settings is not None:
         APP_BACKGROUND = getattr(settings, "app_background", APP_BACKGROUND)
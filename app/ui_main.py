@@ -2,17 +2,24 @@
 
 from __future__ import annotations
 
+import logging
+import os
 import sys
 import shutil
+import threading
+from dataclasses import replace
+from functools import lru_cache, partial
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from PyQt6 import QtCore, QtGui, QtWidgets
 from PyQt6.QtGui import QIcon, QStandardItem, QStandardItemModel
 
 from . import styles
 from . import __version__
+from .services.files import load_versions
 from .services.versioning import VersionManager
-from .services.morphology import MorphologyService, MorphologyHighlighter
+from .services.workers import Worker
 from .services.glossary import (
     Glossary,
     create_glossary,
@@ -23,13 +30,19 @@ from .services.glossary import (
     export_csv,
 )
 from .glossary import GlossaryTableModel
-from .settings import AppSettings, SettingsDialog
-from .services.synonyms import fetch_synonyms as fetch_synonyms_datamuse
-from .models import fetch_synonyms_llm, _MODELS
+from .settings import AppSettings
+from .models import TRANSLATORS
+from .settings_dialog import SettingsDialog
 from .diff_utils import DiffHighlighter
 from .project_manager import Project, ProjectManager
 from .services.project import ProjectManager as ProjectDataManager
 
+if TYPE_CHECKING:
+    from .services.morphology import MorphologyHighlighter
+    from .services.project import Project as ProjectData
+
+
+@lru_cache(maxsize=128)
 def resource_path(name: str) -> str:
     """Return absolute path to resource, compatible with PyInstaller."""
     base_path = getattr(sys, "_MEIPASS", Path(__file__).resolve().parent)
@@ -39,6 +52,168 @@ def resource_path(name: str) -> str:
     return str(path)
 
 
+@lru_cache(maxsize=32)
+def _icon(name: str) -> QIcon:
+    """Return the bundled icon *name*, decoding each image only once."""
+    return QIcon(resource_path(name))
+
+
+# Size of project icons in the project tree.
+_PROJECT_ICON_SIZE = 32
+
+# Item data role holding the cache key of a project tree item's icon.
+_ICON_KEY_ROLE = QtCore.Qt.ItemDataRole.UserRole.value + 1
+
+
+def _project_pixmap(path: str) -> QtGui.QPixmap:
+    """Return the image at *path* scaled for the project tree.
+
+    Scaled pixmaps are kept in :class:`QPixmapCache` under the file's
+    modification time, so tree refreshes neither decode nor rescale an
+    unchanged image.  A null pixmap is returned for unreadable files.
+    """
+    try:
+        key = f"project-icon:{path}:{os.stat(path).st_mtime_ns}"
+    except OSError:
+        return QtGui.QPixmap()
+    pixmap = QtGui.QPixmapCache.find(key)
+    if pixmap is None:
+        pixmap = QtGui.QPixmap(path)
+        if pixmap.isNull():
+            return pixmap
+        pixmap = pixmap.scaled(
+            _PROJECT_ICON_SIZE,
+            _PROJECT_ICON_SIZE,
+            QtCore.Qt.AspectRatioMode.KeepAspectRatio,
+            QtCore.Qt.TransformationMode.SmoothTransformation,
+        )
+        QtGui.QPixmapCache.insert(key, pixmap)
+    return pixmap
+
+
+@lru_cache(maxsize=1)
+def _empty_project_pixmap() -> QtGui.QPixmap:
+    """Return the fallback project icon, looked up and scaled only once."""
+    return _project_pixmap("assets/empty_project.png")
+
+
+@lru_cache(maxsize=8)
+def _build_stylesheet(
+    app_background: str,
+    text_color: str,
+    accent_color: str,
+    neon_color: str,
+    neon_intensity: int,
+    neon_width: int,
+) -> str:
+    """Return the main window stylesheet for the given appearance settings."""
+    glow_rule = styles.neon_glow_rule(neon_color, neon_intensity, neon_width)
+    focus_rule = styles.focus_hover_rule(accent_color)
+    return f"""
+    QWidget {{
+        background-color: {app_background};
+        color: {text_color};
+    }}
+    QTextEdit,
+    QPlainTextEdit,
+    QLineEdit {{
+        background-color: {styles.FIELD_BACKGROUND};
+        color: {text_color};
+        border: 1px solid transparent;
+        border-radius: 6px;
+    }}
+    QTableView#glossary {{
+        background-color: {styles.GLOSSARY_BACKGROUND};
+        border: 1px solid transparent;
+        border-radius: 6px;
+    }}
+    QLabel#counter {{
+        color: rgba(255, 255, 255, 128);
+        font-size: 10px;
+    }}
+    QPushButton {{
+        padding: 2px 6px;
+        min-height: 20px;
+        border: 1px solid transparent;
+        border-radius: 6px;
+    }}
+    {focus_rule}
+    {glow_rule}
+    """
+
+
+@lru_cache(maxsize=16)
+def _font(family: str, size: int) -> QtGui.QFont:
+    """Return a shared font for *family* at *size* points.
+
+    Built on first use, once the application and its fonts exist.
+    """
+    return QtGui.QFont(family, size)
+
+
+# Synonyms per ``(word, provider, model)``; empty results (usually network
+# failures) are not stored so the lookup is retried next time.
+# Lookups run on pool threads, so every access holds ``_SYNONYM_LOCK``.
+_SYNONYM_CACHE: dict[tuple[str, str, str], tuple[str, ...]] = {}
+_SYNONYM_CACHE_SIZE = 512
+_SYNONYM_LOCK = threading.Lock()
+
+
+def _synonym_key(word: str, provider: str, model: str) -> tuple[str, str, str]:
+    return (word.lower(), provider, model if provider == "model" else "")
+
+
+def _cached_synonyms(word: str, provider: str, model: str) -> tuple[str, ...] | None:
+    """Return the stored synonyms for *word*, or ``None`` if not looked up yet."""
+    with _SYNONYM_LOCK:
+        return _SYNONYM_CACHE.get(_synonym_key(word, provider, model))
+
+
+def _lookup_synonyms(word: str, provider: str, model: str) -> tuple[str, ...]:
+    """Return synonyms for *word*, reusing earlier results of the session.
+
+    Cache misses go to the network; call this from a worker thread.
+    """
+    cached = _cached_synonyms(word, provider, model)
+    if cached is not None:
+        return cached
+    # Imported here: the model clients pull in their HTTP/SDK dependencies.
+    if provider == "model":
+        from .models import fetch_synonyms_llm
+
+        synonyms = tuple(fetch_synonyms_llm(word, model))
+    else:
+        from .services.synonyms import fetch_synonyms
+
+        synonyms = tuple(fetch_synonyms(word))
+    if synonyms:
+        with _SYNONYM_LOCK:
+            if len(_SYNONYM_CACHE) >= _SYNONYM_CACHE_SIZE:
+                del _SYNONYM_CACHE[next(iter(_SYNONYM_CACHE))]
+            _SYNONYM_CACHE[_synonym_key(word, provider, model)] = synonyms
+    return synonyms
+
+
+class _VisibilityFilter(QtCore.QObject):
+    """Report whether the watched window is on screen when that may change."""
+
+    _EVENTS = frozenset({
+        QtCore.QEvent.Type.Show,
+        QtCore.QEvent.Type.Hide,
+        QtCore.QEvent.Type.WindowStateChange,
+    })
+
+    def __init__(self, window: QtWidgets.QWidget, callback) -> None:
+        super().__init__(window)
+        self._callback = callback
+        window.installEventFilter(self)
+
+    def eventFilter(self, obj, event) -> bool:  # noqa: N802 (Qt API)
+        if event.type() in self._EVENTS:
+            self._callback(obj.isVisible() and not obj.isMinimized())
+        return False
+
+
 class Ui_MainWindow(object):
     def setupUi(self, MainWindow, settings: AppSettings | None = None):
         print(f"Application version: {__version__}")
@@ -51,6 +226,8 @@ class Ui_MainWindow(object):
         self._updating_translation = False
 
         self.centralwidget = QtWidgets.QWidget(parent=MainWindow)
+        # Suppress repaints while the widget tree is being assembled.
+        self.centralwidget.setUpdatesEnabled(False)
         MainWindow.setCentralWidget(self.centralwidget)
 
         self.main_layout = QtWidgets.QVBoxLayout(self.centralwidget)
@@ -89,9 +266,13 @@ class Ui_MainWindow(object):
         self.archived_root.setFlags(QtCore.Qt.ItemFlag.ItemIsEnabled)
         self.project_model.appendRow(self.active_root)
         self.project_model.appendRow(self.archived_root)
+        self._project_items: dict[str, QStandardItem] = {}
         self.project_tree.setModel(self.project_model)
-        self.project_tree.setIconSize(QtCore.QSize(32, 32))
+        self.project_tree.setIconSize(
+            QtCore.QSize(_PROJECT_ICON_SIZE, _PROJECT_ICON_SIZE)
+        )
         self.project_tree.setHeaderHidden(True)
+        self.project_tree.setUniformRowHeights(True)
         self.project_tree.expandAll()
         self.project_splitter = QtWidgets.QSplitter(
             QtCore.Qt.Orientation.Horizontal, parent=self.project_widget
@@ -99,6 +280,8 @@ class Ui_MainWindow(object):
         self.project_splitter.addWidget(self.project_tree)
         self.project_summary = QtWidgets.QTextEdit(parent=self.project_widget)
         self.project_summary.setReadOnly(True)
+        self.project_summary.setAcceptRichText(False)
+        self.project_summary.document().setUndoRedoEnabled(False)
         self.project_summary.setPlaceholderText("Сводка проекта")
         self.project_splitter.addWidget(self.project_summary)
         self.project_splitter.setSizes([200, 0])
@@ -123,6 +306,7 @@ class Ui_MainWindow(object):
         self.archive_project_btn.clicked.connect(self._archive_project)
         self.delete_project_btn.clicked.connect(self._delete_project)
         self._refresh_project_tree()
+        self._summary_worker: Worker | None = None
         self.project_tree.selectionModel().currentChanged.connect(
             self._display_project_summary
         )
@@ -135,12 +319,9 @@ class Ui_MainWindow(object):
 
         # Menu bar
         self.menu_bar = MainWindow.menuBar()
-        self.menu_bar.setFont(QtGui.QFont(self.settings.header_font, 10))
         self.settings_menu = self.menu_bar.addMenu("")
-        self.settings_menu.setFont(QtGui.QFont(self.settings.header_font, 10))
         self.settings_action = QtGui.QAction(parent=MainWindow)
-        self.settings_action.setIcon(QIcon(resource_path("настройки.png")))
-        self.settings_action.setFont(QtGui.QFont(self.settings.header_font, 10))
+        self.settings_action.setIcon(_icon("настройки.png"))
         self.settings_menu.addAction(self.settings_action)
         self.settings_action.triggered.connect(self._open_settings)
 
@@ -155,7 +336,7 @@ class Ui_MainWindow(object):
         self.model_combo = QtWidgets.QComboBox(parent=self.centralwidget)
         models = [
             name
-            for name in sorted(_MODELS.keys())
+            for name in sorted(TRANSLATORS)
             if getattr(self.settings, f"{name}_key", "")
         ]
         self.model_combo.addItems(models)
@@ -164,14 +345,14 @@ class Ui_MainWindow(object):
             if idx != -1:
                 self.model_combo.setCurrentIndex(idx)
         self.save_btn = QtWidgets.QPushButton(parent=self.centralwidget)
-        self.save_btn.setIcon(QIcon(resource_path("сохранить.png")))
+        self.save_btn.setIcon(_icon("сохранить.png"))
         self.nav_layout.addWidget(self.prev_btn)
         self.nav_layout.addWidget(self.chapter_combo)
         self.nav_layout.addWidget(self.next_btn)
         self.nav_layout.addWidget(self.model_combo)
         self.nav_layout.addWidget(self.save_btn)
         self.toggle_glossary_btn = QtWidgets.QPushButton(parent=self.centralwidget)
-        self.toggle_glossary_btn.setIcon(QIcon(resource_path("свернуть.png")))
+        self.toggle_glossary_btn.setIcon(_icon("свернуть.png"))
         self.toggle_glossary_btn.setCheckable(True)
         self.nav_layout.addWidget(self.toggle_glossary_btn)
         self.main_layout.addLayout(self.nav_layout)
@@ -186,7 +367,7 @@ class Ui_MainWindow(object):
         self.original_layout = QtWidgets.QVBoxLayout(self.original_widget)
         self.original_layout.setContentsMargins(0, 0, 0, 0)
         self.original_layout.setSpacing(4)
-        self.original_edit = QtWidgets.QTextEdit(parent=self.original_widget)
+        self.original_edit = QtWidgets.QPlainTextEdit(parent=self.original_widget)
         self.original_edit.setPlaceholderText("Оригинал")
         self.original_counter = QtWidgets.QLabel("0", parent=self.original_widget)
         self.original_counter.setObjectName("counter")
@@ -201,7 +382,7 @@ class Ui_MainWindow(object):
         self.translation_layout = QtWidgets.QVBoxLayout(self.translation_widget)
         self.translation_layout.setContentsMargins(0, 0, 0, 0)
         self.translation_layout.setSpacing(4)
-        self.translation_edit = QtWidgets.QTextEdit(parent=self.translation_widget)
+        self.translation_edit = QtWidgets.QPlainTextEdit(parent=self.translation_widget)
         self.translation_edit.setPlaceholderText("Перевод")
         self.translation_edit.setContextMenuPolicy(
             QtCore.Qt.ContextMenuPolicy.CustomContextMenu
@@ -215,6 +396,12 @@ class Ui_MainWindow(object):
             self._show_synonym_menu_at_cursor
         )
         self.translation_edit.addAction(self.synonym_action)
+        # One menu is refilled for every lookup; the word to replace is kept
+        # in ``_synonym_cursor`` rather than captured per action.
+        self.synonym_menu = QtWidgets.QMenu(self.translation_edit)
+        self.synonym_menu.triggered.connect(self._on_synonym_chosen)
+        self._synonym_cursor: QtGui.QTextCursor | None = None
+        self._synonym_worker: Worker | None = None
         self.translation_counter = QtWidgets.QLabel("0", parent=self.translation_widget)
         self.translation_counter.setObjectName("counter")
         self.translation_counter.setAlignment(QtCore.Qt.AlignmentFlag.AlignRight)
@@ -237,7 +424,7 @@ class Ui_MainWindow(object):
         self.mini_prompt_layout = QtWidgets.QVBoxLayout(self.mini_prompt_widget)
         self.mini_prompt_layout.setContentsMargins(0, 0, 0, 0)
         self.mini_prompt_layout.setSpacing(4)
-        self.mini_prompt_edit = QtWidgets.QTextEdit(parent=self.mini_prompt_widget)
+        self.mini_prompt_edit = QtWidgets.QPlainTextEdit(parent=self.mini_prompt_widget)
         self.mini_prompt_edit.setPlaceholderText("Мини‑промпт")
         self.mini_prompt_layout.addWidget(self.mini_prompt_edit)
 
@@ -256,26 +443,32 @@ class Ui_MainWindow(object):
             self.translation_edit.document(),
             color=self.settings.highlight_color,
         )
-        self.morphology_service = MorphologyService()
         self.morphology_highlighter: MorphologyHighlighter | None = None
+        # Cleared while the translation exceeds ``settings.highlight_limit``.
+        self._highlighting = True
+        # Morphology analysis re-parses the whole text, so it waits for a
+        # pause in typing like the other translation updates.
+        self.morphology_timer = QtCore.QTimer(MainWindow)
+        self.morphology_timer.setInterval(400)
+        self.morphology_timer.setSingleShot(True)
+        self.morphology_timer.timeout.connect(self._update_morphology)
         if self.settings.machine_check:
             self._enable_machine_check()
         self.original_translation = ""
 
-        base = Path(
-            self.settings.translation_path
-            or self.settings.original_path
-            or "."
-        )
+        # Version history is parsed on the thread pool and the last revision
+        # shown when it arrives; earlier access loads it synchronously.
+        base = self.settings.base_path
         base.mkdir(parents=True, exist_ok=True)
-        history_path = base / "versions.json"
-        self.version_manager = VersionManager(history_path)
-        if self.version_manager.versions:
-            last = self.version_manager.versions[self.version_manager.index]["text"]
-            self.translation_edit.setPlainText(last)
-            self.original_translation = self.version_manager.versions[0]["text"]
-            self.diff_highlighter.set_base(self.original_translation)
-            self.diff_highlighter.update_diff()
+        self._history_path = base / "versions.json"
+        self._version_manager: VersionManager | None = None
+        # Cleared by ``cancel_history_restore`` once a chapter is loaded; the
+        # stored revision may belong to another chapter then.
+        self._restore_history = True
+        self._history_worker = Worker(load_versions, self._history_path)
+        self._history_worker.finished.connect(self._on_history_loaded)
+        self._history_worker.error.connect(self._on_history_error)
+        self._history_worker.start()
 
         # Glossary panel
         self.glossary_widget = QtWidgets.QWidget(parent=self.centralwidget)
@@ -332,6 +525,7 @@ class Ui_MainWindow(object):
         self.delete_glossary_btn.clicked.connect(self._delete_glossary)
         self.import_glossary_btn.clicked.connect(self._import_glossary)
         self.export_glossary_btn.clicked.connect(self._export_glossary)
+        self._export_worker: Worker | None = None
         self.add_pair_btn.clicked.connect(self._add_pair)
         self.remove_pair_btn.clicked.connect(self._remove_pair)
         self.auto_prompt_checkbox.toggled.connect(self._on_auto_prompt_toggled)
@@ -344,92 +538,105 @@ class Ui_MainWindow(object):
         self.status_layout.addStretch()
         # Display application version retrieved from ``app.__version__``
         self.version_label = QtWidgets.QLabel(__version__, parent=self.centralwidget)
-        self.version_label.setFont(QtGui.QFont(self.settings.header_font, 10))
         self.status_layout.addWidget(self.version_label)
         self.timer_label = QtWidgets.QLabel("00:00:00", parent=self.centralwidget)
-        self.timer_label.setFont(QtGui.QFont(self.settings.header_font, 10))
         self.status_layout.addWidget(self.timer_label)
         self.main_layout.addLayout(self.status_layout)
         # Ensure the main splitter grows with the window while the status bar stays fixed
         self.main_layout.setStretch(1, 1)  # splitter fills remaining space
         self.main_layout.setStretch(2, 0)  # status bar keeps minimal height
 
-        # Fonts
-        base_font = QtGui.QFont(self.settings.base_font, self.settings.font_size)
-        self.original_edit.setFont(base_font)
-        self.translation_edit.setFont(base_font)
-        self.mini_prompt_edit.setFont(base_font)
-        self.glossary_table.setFont(base_font)
+        # Fonts: one header and one base QFont shared by all widgets
+        self._applied_fonts: tuple[str, int, str] | None = None
+        self._apply_font_size()
         self._apply_style()
 
         # Timer and character counters
         self.elapsed = 0
+        self._timer_prefix = ""
         self.timer = QtCore.QTimer(MainWindow)
         self.timer.setInterval(1000)
         self.timer.timeout.connect(self._update_timer)
-        self._start_timer()
+        self._timer_paused = False
+        # The editing timer only runs while the translation is being edited;
+        # it stops after 30 seconds without changes.
+        self.idle_timer = QtCore.QTimer(MainWindow)
+        self.idle_timer.setInterval(30000)
+        self.idle_timer.setSingleShot(True)
+        self.idle_timer.timeout.connect(self._on_editing_idle)
+        self._on_editing_activity()
+        # Stop the per-second tick while the window is hidden or minimised.
+        self._visibility_filter = _VisibilityFilter(
+            MainWindow, self._on_window_visibility
+        )
 
-        self.original_edit.textChanged.connect(self._update_original_counter)
+        # Character counters are recomputed once typing pauses rather than
+        # on every keystroke.
+        self.original_counter_timer = QtCore.QTimer(MainWindow)
+        self.original_counter_timer.setInterval(250)
+        self.original_counter_timer.setSingleShot(True)
+        self.original_counter_timer.timeout.connect(self._update_original_counter)
+        self.original_edit.textChanged.connect(self.original_counter_timer.start)
+        self.translation_counter_timer = QtCore.QTimer(MainWindow)
+        self.translation_counter_timer.setInterval(250)
+        self.translation_counter_timer.setSingleShot(True)
+        self.translation_counter_timer.timeout.connect(
+            self._refresh_translation_counter
+        )
         self.translation_timer = QtCore.QTimer()
         self.translation_timer.setInterval(500)
         self.translation_timer.setSingleShot(True)
         self.translation_timer.timeout.connect(self._commit_translation_change)
-        self.translation_edit.textChanged.connect(self._update_translation_counter)
+        # Revisions are recorded once typing pauses for longer than the diff
+        # refresh delay, so a burst of edits becomes a single history entry.
+        self.version_timer = QtCore.QTimer(MainWindow)
+        self.version_timer.setInterval(1500)
+        self.version_timer.setSingleShot(True)
+        self.version_timer.timeout.connect(self._record_version)
+        # One slot drives every timer that reacts to translation edits.
+        self.translation_edit.textChanged.connect(self._on_translation_changed)
         self.undo_btn.clicked.connect(self._restore_prev)
         self.redo_btn.clicked.connect(self._restore_next)
 
-        self._load_glossaries()
+        # The glossary folder is scanned once the event loop is running so
+        # the window can paint first.
+        QtCore.QTimer.singleShot(0, self._load_glossaries)
 
         self.retranslateUi(MainWindow)
-        QtCore.QMetaObject.connectSlotsByName(MainWindow)
+        self.centralwidget.setUpdatesEnabled(True)
 
     def _apply_style(self) -> None:
-        glow_rule = styles.neon_glow_rule(
+        style_sheet = _build_stylesheet(
+            self.settings.app_background,
+            self.settings.text_color,
+            self.settings.accent_color,
             self.settings.neon_color,
             self.settings.neon_intensity,
-            self.settings.neon_width,  # configurable border width
-        )
-        focus_rule = styles.focus_hover_rule(self.settings.accent_color)
-        style_sheet = f"""
-        QWidget {{
-            background-color: {self.settings.app_background};
-            color: {self.settings.text_color};
-            font-family: {self.settings.base_font};
-        }}
-        QTextEdit,
-        QLineEdit {{
-            background-color: {styles.FIELD_BACKGROUND};
-            color: {self.settings.text_color};
-            border: 1px solid transparent;
-            border-radius: 6px;
-        }}
-        QTableView#glossary {{
-            background-color: {styles.GLOSSARY_BACKGROUND};
-            border: 1px solid transparent;
-            border-radius: 6px;
-        }}
-        QLabel#counter {{
-            color: rgba(255, 255, 255, 128);
-            font-size: 10px;
-        }}
-        QPushButton {{
-            padding: 2px 6px;
-            min-height: 20px;
-            border: 1px solid transparent;
-            border-radius: 6px;
-        }}
-        {focus_rule}
-        {glow_rule}
-        """
-        self.centralwidget.setStyleSheet(style_sheet)
+            self.settings.neon_width,
+        )
+        # Re-applying an identical sheet would still re-polish every child.
+        if style_sheet != self.centralwidget.styleSheet():
+            self.centralwidget.setStyleSheet(style_sheet)
 
     def _apply_font_size(self) -> None:
-        base_font = QtGui.QFont(self.settings.base_font, self.settings.font_size)
+        # setFont relayouts whole documents even when the font is unchanged.
+        fonts = (
+            self.settings.base_font,
+            self.settings.font_size,
+            self.settings.header_font,
+        )
+        if fonts == self._applied_fonts:
+            return
+        self._applied_fonts = fonts
+        # Family only (size -1 is left unset), inherited by every child
+        # without a font of its own; cheaper than a QSS font-family rule.
+        self.centralwidget.setFont(_font(self.settings.base_font, -1))
+        base_font = _font(self.settings.base_font, self.settings.font_size)
         self.original_edit.setFont(base_font)
         self.translation_edit.setFont(base_font)
         self.mini_prompt_edit.setFont(base_font)
         self.glossary_table.setFont(base_font)
-        header_font = QtGui.QFont(self.settings.header_font, 10)
+        header_font = _font(self.settings.header_font, 10)
         self.menu_bar.setFont(header_font)
         self.settings_menu.setFont(header_font)
         self.settings_action.setFont(header_font)
@@ -439,43 +646,108 @@ class Ui_MainWindow(object):
     # --- internal helpers -------------------------------------------------
     def _update_timer(self) -> None:
         self.elapsed += 1
-        hours, remainder = divmod(self.elapsed, 3600)
-        minutes, seconds = divmod(remainder, 60)
-        self.timer_label.setText(f"{hours:02d}:{minutes:02d}:{seconds:02d}")
+        seconds = self.elapsed % 60
+        # The "HH:MM:" prefix only changes once a minute.
+        if not seconds or not self._timer_prefix:
+            hours, minutes = divmod(self.elapsed // 60, 60)
+            self._timer_prefix = f"{hours:02d}:{minutes:02d}:"
+        self._set_timer_text(f"{self._timer_prefix}{seconds:02d}")
+
+    def _set_timer_text(self, text: str) -> None:
+        # Unchanged text would still make the label re-layout and repaint.
+        if text != self.timer_label.text():
+            self.timer_label.setText(text)
 
     def _start_timer(self) -> None:
         if not self.timer.isActive():
             self.timer.start()
 
+    def _on_editing_activity(self) -> None:
+        self._start_timer()
+        self.idle_timer.start()
+
+    def _on_editing_idle(self) -> None:
+        self.timer.stop()
+        self._timer_paused = False
+
+    def _on_window_visibility(self, visible: bool) -> None:
+        if not visible:
+            if self.timer.isActive():
+                self.timer.stop()
+                self._timer_paused = True
+        elif self._timer_paused:
+            self._timer_paused = False
+            self.timer.start()
+
     def reset_timer(self) -> None:
         """Reset the editing timer."""
 
         self.timer.stop()
+        self.idle_timer.stop()
+        self._timer_paused = False
         self.elapsed = 0
-        self.timer_label.setText("00:00:00")
+        self._timer_prefix = ""
+        self._set_timer_text("00:00:00")
+
+    @staticmethod
+    def _char_count(edit: QtWidgets.QPlainTextEdit) -> int:
+        """Return the length of *edit*'s text without copying it out.
+
+        ``characterCount`` includes the final paragraph separator.  It counts
+        UTF-16 code units, so every character counter goes through this
+        helper to keep the displayed numbers consistent.
+        """
+        return edit.document().characterCount() - 1
 
     def _update_original_counter(self) -> None:
-        self.original_counter.setText(str(len(self.original_edit.toPlainText())))
+        self.original_counter.setText(str(self._char_count(self.original_edit)))
 
-    def _update_translation_counter(self) -> None:
+    def _on_translation_changed(self) -> None:
+        self._on_editing_activity()
+        if self.morphology_highlighter is not None:
+            self.morphology_timer.start()
         if self._updating_translation:
             return
         self._updating_translation = True
         try:
             self.translation_timer.start()
-            text = self.translation_edit.toPlainText()
-            self.translation_counter.setText(str(len(text)))
+            self.translation_counter_timer.start()
+            self.version_timer.start()
         finally:
             self._updating_translation = False
 
+    def _refresh_translation_counter(self) -> None:
+        self.translation_counter.setText(str(self._char_count(self.translation_edit)))
+
     def _commit_translation_change(self) -> None:
         self.translation_timer.stop()
         text = self.translation_edit.toPlainText()
+        self._apply_highlight_limit(len(text))
         if not self.original_translation:
             self.original_translation = text
             self.diff_highlighter.set_base(text)
-        self.version_manager.add_version(text)
-        self.diff_highlighter.update_diff()
+        else:
+            self.diff_highlighter.update_diff(text)
+
+    def _apply_highlight_limit(self, length: int) -> None:
+        """Switch highlighting off while the translation is *length* long.
+
+        Above ``settings.highlight_limit`` characters the diff and morphology
+        highlighters are detached; they come back once the text is shorter.
+        """
+        enabled = length <= self.settings.highlight_limit
+        if enabled == self._highlighting:
+            return
+        self._highlighting = enabled
+        self.diff_highlighter.set_enabled(enabled)
+        if not enabled:
+            self._disable_machine_check()
+        elif self.settings.machine_check:
+            self._enable_machine_check()
+
+    def _record_version(self) -> None:
+        self.version_timer.stop()
+        self.version_manager.add_version(self.translation_edit.toPlainText())
 
     def _open_translation_context_menu(self, pos: QtCore.QPoint) -> None:
         menu = self.translation_edit.createStandardContextMenu()
@@ -491,25 +763,22 @@ class Ui_MainWindow(object):
         self._show_synonym_menu(pos)
 
     def _enable_machine_check(self) -> None:
-        if self.morphology_highlighter is None:
+        if self.morphology_highlighter is None and self._highlighting:
+            from .services.morphology import MorphologyHighlighter, MorphologyService
+
             self.morphology_highlighter = MorphologyHighlighter(
-                self.translation_edit.document(), self.morphology_service
-            )
-            self.translation_edit.textChanged.connect(
-                self.morphology_highlighter.update_errors
+                self.translation_edit.document(), MorphologyService()
             )
+            QtCore.QTimer.singleShot(0, self._update_morphology)
+
+    def _update_morphology(self) -> None:
+        if self.morphology_highlighter is not None:
             self.morphology_highlighter.update_errors()
 
     def _disable_machine_check(self) -> None:
         if self.morphology_highlighter is not None:
-            try:
-                self.translation_edit.textChanged.disconnect(
-                    self.morphology_highlighter.update_errors
-                )
-            except TypeError:
-                pass
-            self.morphology_highlighter.errors = []
-            self.morphology_highlighter.rehighlight()
+            self.morphology_timer.stop()
+            # Detaching clears the formats it applied to every block.
             self.morphology_highlighter.setDocument(None)
             self.morphology_highlighter.deleteLater()
             self.morphology_highlighter = None
@@ -521,20 +790,58 @@ class Ui_MainWindow(object):
         word = cursor.selectedText().strip()
         if not word:
             return
-        if self.settings.synonym_provider == "model":
-            synonyms = fetch_synonyms_llm(word, self.settings.model)
-        else:
-            synonyms = fetch_synonyms_datamuse(word)
+        provider, model = self.settings.synonym_provider, self.settings.model
+        cached = _cached_synonyms(word, provider, model)
+        if cached is not None:
+            self._open_synonym_menu(cursor, pos, cached)
+            return
+        # Fetch on the thread pool; the menu opens when the result arrives.
+        worker = Worker(_lookup_synonyms, word, provider, model)
+        worker.finished.connect(
+            partial(self._on_synonyms_ready, worker, cursor, pos, word)
+        )
+        worker.error.connect(partial(self._on_synonyms_failed, worker))
+        self._synonym_worker = worker
+        worker.start()
+
+    def _on_synonyms_ready(
+        self,
+        worker: Worker,
+        cursor: QtGui.QTextCursor,
+        pos: QtCore.QPoint,
+        word: str,
+        synonyms: tuple[str, ...],
+    ) -> None:
+        if worker is not self._synonym_worker:
+            return  # superseded by a newer lookup
+        self._synonym_worker = None
+        # Skip the menu if the word was edited while the lookup ran.
+        if cursor.selectedText().strip() == word:
+            self._open_synonym_menu(cursor, pos, synonyms)
+
+    def _on_synonyms_failed(self, worker: Worker, exc: Exception) -> None:
+        if worker is self._synonym_worker:
+            self._synonym_worker = None
+        logging.warning("Synonym lookup failed: %s", exc)
+
+    def _open_synonym_menu(
+        self,
+        cursor: QtGui.QTextCursor,
+        pos: QtCore.QPoint,
+        synonyms: tuple[str, ...],
+    ) -> None:
         if not synonyms:
             return
-        menu = QtWidgets.QMenu(self.translation_edit)
+        self.synonym_menu.clear()
         for syn in synonyms:
-            action = menu.addAction(syn)
-            action.triggered.connect(
-                lambda checked=False, s=syn, c=QtGui.QTextCursor(cursor):
-                    self._replace_with_synonym(c, s)
-            )
-        menu.exec(self.translation_edit.mapToGlobal(pos))
+            self.synonym_menu.addAction(syn).setData(syn)
+        self._synonym_cursor = cursor
+        self.synonym_menu.exec(self.translation_edit.mapToGlobal(pos))
+
+    def _on_synonym_chosen(self, action: QtGui.QAction) -> None:
+        if self._synonym_cursor is not None:
+            self._replace_with_synonym(self._synonym_cursor, action.data())
+            self._synonym_cursor = None
 
     def _replace_with_synonym(
         self, cursor: QtGui.QTextCursor, synonym: str
@@ -549,6 +856,7 @@ class Ui_MainWindow(object):
         prev_dir = self.settings.projects_dir
         dialog = SettingsDialog(self.settings, self.centralwidget)
         result = dialog.exec()
+        dialog.deleteLater()
         if result == QtWidgets.QDialog.DialogCode.Accepted:
             if self.settings.projects_dir != prev_dir:
                 self._migrate_project_dir(prev_dir, self.settings.projects_dir)
@@ -577,23 +885,79 @@ class Ui_MainWindow(object):
         self.project_service = ProjectDataManager(new_projects)
         self._refresh_project_tree()
 
+    @property
+    def version_manager(self) -> VersionManager:
+        """Translation history, loaded from disk on first access."""
+        if self._version_manager is None:
+            self._version_manager = VersionManager(self._history_path)
+        return self._version_manager
+
+    def flush_versions(self) -> None:
+        """Persist the version history if it has been loaded."""
+        if self.version_timer.isActive():
+            self._record_version()
+        if self._version_manager is not None:
+            self._version_manager.flush()
+
+    def _on_history_loaded(self, versions: list[dict]) -> None:
+        self._history_worker = None
+        if self._version_manager is not None:
+            return
+        self._version_manager = VersionManager(
+            self._history_path, versions, load=False
+        )
+        # Do not overwrite text typed while the history was loading.
+        if self._restore_history and self.translation_edit.document().isEmpty():
+            self._restore_last_version()
+
+    def cancel_history_restore(self) -> None:
+        """Keep the last stored revision from being shown once history loads.
+
+        Called when a chapter replaces the editors' contents, so a history
+        that arrives afterwards does not paste an unrelated translation.
+        """
+        self._restore_history = False
+
+    def _on_history_error(self, exc: Exception) -> None:
+        # ``version_manager`` retries the read when it is first needed.
+        self._history_worker = None
+
+    def _restore_last_version(self) -> None:
+        manager = self.version_manager
+        if not manager.versions:
+            return
+        self._show_version(manager.text)
+        self.translation_edit.document().clearUndoRedoStacks()
+        self.original_translation = manager.base_text
+        self.diff_highlighter.set_base(self.original_translation)
+
     def _restore_prev(self) -> None:
+        if self.version_timer.isActive():
+            self._record_version()
         text = self.version_manager.undo()
         if text is not None:
-            self.translation_edit.blockSignals(True)
-            self.translation_edit.setPlainText(text)
-            self.translation_edit.blockSignals(False)
-            self.translation_counter.setText(str(len(text)))
-            self.diff_highlighter.update_diff()
+            self._show_version(text)
 
     def _restore_next(self) -> None:
+        if self.version_timer.isActive():
+            self._record_version()
         text = self.version_manager.redo()
         if text is not None:
-            self.translation_edit.blockSignals(True)
-            self.translation_edit.setPlainText(text)
-            self.translation_edit.blockSignals(False)
-            self.translation_counter.setText(str(len(text)))
-            self.diff_highlighter.update_diff()
+            self._show_version(text)
+
+    def _show_version(self, text: str) -> None:
+        """Display a stored revision without recording it as a new one.
+
+        Unlike ``blockSignals`` this keeps other ``textChanged`` listeners,
+        such as the morphology highlighter, in sync with the restored text.
+        """
+        self._apply_highlight_limit(len(text))
+        self._updating_translation = True
+        try:
+            self.diff_highlighter.replace_text(text)
+        finally:
+            self._updating_translation = False
+        self._refresh_translation_counter()
 
     def _toggle_glossary(self, checked: bool) -> None:
         if checked:
@@ -610,16 +974,19 @@ class Ui_MainWindow(object):
         folder = Path(__file__).resolve().parent.parent / "data"
         folder.mkdir(parents=True, exist_ok=True)
         self._glossary_folder = folder
-        self.glossary_combo.blockSignals(True)
-        self.glossary_combo.clear()
-        for path in list_glossaries(folder):
-            self.glossary_combo.addItem(path.stem, path)
-        self.glossary_combo.blockSignals(False)
+        paths = list_glossaries(folder)
+        with QtCore.QSignalBlocker(self.glossary_combo):
+            self.glossary_combo.clear()
+            # One bulk insert; item data does not affect the popup layout.
+            self.glossary_combo.addItems([path.stem for path in paths])
+            for i, path in enumerate(paths):
+                self.glossary_combo.setItemData(i, path)
         if self.glossary_combo.count():
             self.glossary_combo.setCurrentIndex(0)
+            # Item data is always the glossary's Path.
             current = self.glossary_combo.currentData()
             if current:
-                self._load_glossary(Path(current))
+                self._load_glossary(current)
         else:
             glossary = create_glossary("glossary", folder)
             self.glossary_combo.addItem(glossary.name, glossary.file)
@@ -627,10 +994,11 @@ class Ui_MainWindow(object):
             self._load_glossary(glossary.file)
 
     def _load_glossary(self, path: Path) -> None:
+        # Pending background writes may target this very file.
+        self.glossary_model.flush()
         self.current_glossary = Glossary.load(path)
-        self.auto_prompt_checkbox.blockSignals(True)
-        self.auto_prompt_checkbox.setChecked(self.current_glossary.auto_to_prompt)
-        self.auto_prompt_checkbox.blockSignals(False)
+        with QtCore.QSignalBlocker(self.auto_prompt_checkbox):
+            self.auto_prompt_checkbox.setChecked(self.current_glossary.auto_to_prompt)
         self._populate_table()
 
     def _populate_table(self) -> None:
@@ -639,7 +1007,7 @@ class Ui_MainWindow(object):
     def _on_glossary_selected(self, index: int) -> None:
         path = self.glossary_combo.itemData(index)
         if path:
-            self._load_glossary(Path(path))
+            self._load_glossary(path)
 
     def _create_glossary(self) -> None:
         name, ok = QtWidgets.QInputDialog.getText(
@@ -647,6 +1015,7 @@ class Ui_MainWindow(object):
         )
         if not ok or not name:
             return
+        self.glossary_model.flush()
         glossary = create_glossary(name, self._glossary_folder)
         self.glossary_combo.addItem(name, glossary.file)
         self.glossary_combo.setCurrentIndex(self.glossary_combo.count() - 1)
@@ -662,6 +1031,8 @@ class Ui_MainWindow(object):
         )
         if not ok or not new_name:
             return
+        # A pending write would otherwise recreate the file under its old name.
+        self.glossary_model.flush()
         new_path = rename_glossary(self.current_glossary.file, new_name)
         self.current_glossary.name = new_name
         self.current_glossary.file = new_path
@@ -675,6 +1046,8 @@ class Ui_MainWindow(object):
         if idx < 0:
             return
         path = self.glossary_combo.itemData(idx)
+        # Write pending edits first so a delayed save cannot recreate the file.
+        self.glossary_model.flush()
         delete_glossary(path)
         self.glossary_combo.removeItem(idx)
         if self.glossary_combo.count():
@@ -682,9 +1055,8 @@ class Ui_MainWindow(object):
         else:
             self.current_glossary = None
             self.glossary_model.set_glossary(None)
-            self.auto_prompt_checkbox.blockSignals(True)
-            self.auto_prompt_checkbox.setChecked(False)
-            self.auto_prompt_checkbox.blockSignals(False)
+            with QtCore.QSignalBlocker(self.auto_prompt_checkbox):
+                self.auto_prompt_checkbox.setChecked(False)
 
     def _import_glossary(self) -> None:
         path, _ = QtWidgets.QFileDialog.getOpenFileName(
@@ -693,6 +1065,8 @@ class Ui_MainWindow(object):
         if not path:
             return
         glossary = import_csv(path)
+        # Stop a pending write of an old snapshot from replacing the import.
+        self.glossary_model.flush()
         glossary.save(self._glossary_folder / f"{glossary.name}.json")
         self.glossary_combo.addItem(glossary.name, glossary.file)
         self.glossary_combo.setCurrentIndex(self.glossary_combo.count() - 1)
@@ -709,7 +1083,24 @@ class Ui_MainWindow(object):
         )
         if not path:
             return
-        export_csv(self.current_glossary, path)
+        # The worker writes a snapshot, so edits made meanwhile are safe.
+        snapshot = replace(
+            self.current_glossary, entries=dict(self.current_glossary.entries)
+        )
+        worker = Worker(export_csv, snapshot, path)
+        worker.finished.connect(self._on_glossary_exported)
+        worker.error.connect(self._on_glossary_export_error)
+        self._export_worker = worker
+        self.export_glossary_btn.setEnabled(False)
+        worker.start()
+
+    def _on_glossary_exported(self, _result: object = None) -> None:
+        self._export_worker = None
+        self.export_glossary_btn.setEnabled(True)
+
+    def _on_glossary_export_error(self, exc: Exception) -> None:
+        self._on_glossary_exported()
+        QtWidgets.QMessageBox.warning(self.centralwidget, "Экспорт", str(exc))
 
     def _add_pair(self) -> None:
         self.glossary_model.add_pair()
@@ -720,20 +1111,6 @@ class Ui_MainWindow(object):
             return
         self.glossary_model.remove_pair(row)
 
-    def _on_pair_edited(self, item: QtWidgets.QTableWidgetItem):
-        if not self.current_glossary:
-            return
-        row = item.row()
-        column = item.column()
-        src_item = self.glossary_table.item(row, 0)
-        dst_item = self.glossary_table.item(row, 1)
-        if src_item and dst_item:
-            src = src_item.text().strip()
-            dst = dst_item.text().strip()
-            if src:
-                self.current_glossary.add(src, dst)
-                self.current_glossary.save()
-
     # --- project management ---------------------------------------------
     def _selected_project(self) -> Project | None:
         index = self.project_tree.currentIndex()
@@ -746,38 +1123,70 @@ class Ui_MainWindow(object):
         return self.project_manager.get(project_id)
 
     def _refresh_project_tree(self) -> None:
-        self.active_root.removeRows(0, self.active_root.rowCount())
-        self.archived_root.removeRows(0, self.archived_root.rowCount())
-        for proj in self.project_manager.projects:
-            item = QStandardItem(proj.name)
-            item.setData(proj.id, QtCore.Qt.ItemDataRole.UserRole)
-            pixmap = QtGui.QPixmap(proj.icon_path)
+        """Bring the project tree in line with ``project_manager.projects``.
+
+        Items are kept per project id and only updated where the project
+        changed, so renaming or archiving one project touches a single row.
+        """
+        items = self._project_items
+        projects = self.project_manager.projects
+        ids = {proj.id for proj in projects}
+        for project_id in [pid for pid in items if pid not in ids]:
+            item = items.pop(project_id)
+            item.parent().removeRow(item.row())
+        # New and moved rows are collected so each root gets one bulk insert.
+        added: dict[bool, list[QStandardItem]] = {False: [], True: []}
+        for proj in projects:
+            root = self.archived_root if proj.archived else self.active_root
+            item = items.get(proj.id)
+            if item is None:
+                item = QStandardItem(proj.name)
+                item.setData(proj.id, QtCore.Qt.ItemDataRole.UserRole)
+                items[proj.id] = item
+                added[proj.archived].append(item)
+            elif item.parent() is not root:
+                item = item.parent().takeRow(item.row())[0]
+                added[proj.archived].append(item)
+            if item.text() != proj.name:
+                item.setText(proj.name)
+            pixmap = _project_pixmap(proj.icon_path)
             if pixmap.isNull():
-                pixmap = QtGui.QPixmap("assets/empty_project.png")
-            pixmap = pixmap.scaled(
-                32,
-                32,
-                QtCore.Qt.AspectRatioMode.KeepAspectRatio,
-                QtCore.Qt.TransformationMode.SmoothTransformation,
-            )
-            item.setIcon(QtGui.QIcon(pixmap))
-            if proj.archived:
-                self.archived_root.appendRow(item)
-            else:
-                self.active_root.appendRow(item)
-        self.project_tree.expandAll()
+                pixmap = _empty_project_pixmap()
+            if item.data(_ICON_KEY_ROLE) != pixmap.cacheKey():
+                item.setIcon(QtGui.QIcon(pixmap))
+                item.setData(pixmap.cacheKey(), _ICON_KEY_ROLE)
+        for archived, root in ((False, self.active_root), (True, self.archived_root)):
+            if added[archived]:
+                root.appendRows(added[archived])
+                self.project_tree.expand(root.index())
 
     def _display_project_summary(
         self, current: QtCore.QModelIndex, previous: QtCore.QModelIndex
     ) -> None:
         proj = self._selected_project()
         if not proj:
+            self._summary_worker = None
             self.project_summary.clear()
             return
-        meta = self.project_service.load(proj.id, title=proj.name)
+        # Metadata is read on the thread pool; only the latest request is shown.
+        worker = Worker(self.project_service.load, proj.id, title=proj.name)
+        worker.finished.connect(partial(self._on_project_summary_loaded, worker))
+        worker.error.connect(partial(self._on_project_summary_error, worker))
+        self._summary_worker = worker
+        worker.start()
+
+    def _on_project_summary_loaded(self, worker: Worker, meta: ProjectData) -> None:
+        if worker is not self._summary_worker:
+            return  # another project was selected meanwhile
+        self._summary_worker = None
         lines = [f"{ch.name}: {ch.plot}" for ch in meta.chapters]
         self.project_summary.setPlainText("\n".join(lines))
 
+    def _on_project_summary_error(self, worker: Worker, exc: Exception) -> None:
+        if worker is self._summary_worker:
+            self._summary_worker = None
+            self.project_summary.clear()
+
     def _project_context_menu(self, pos: QtCore.QPoint) -> None:
         index = self.project_tree.indexAt(pos)
         if index.isValid():
@@ -851,15 +1260,9 @@ class Ui_MainWindow(object):
         )
         if not path:
             return
-        pixmap = QtGui.QPixmap(path)
-        if pixmap.isNull():
+        # Validates the image and leaves it in the cache for the refresh.
+        if _project_pixmap(path).isNull():
             return
-        pixmap = pixmap.scaled(
-            32,
-            32,
-            QtCore.Qt.AspectRatioMode.KeepAspectRatio,
-            QtCore.Qt.TransformationMode.SmoothTransformation,
-        )
         proj.icon_path = path
         self.project_manager.save()
         self._refresh_project_tree()
@@ -878,9 +1281,9 @@ class Ui_MainWindow(object):
 
 
     def _on_auto_prompt_toggled(self, checked: bool) -> None:
-        if self.current_glossary:
+        if self.current_glossary and self.current_glossary.auto_to_prompt != checked:
             self.current_glossary.auto_to_prompt = checked
-            self.current_glossary.save()
+            self.glossary_model.schedule_save()
 
     def glossary_entries(self) -> dict[str, str]:
         return self.glossary_model.glossary_entries()
@@ -1,4 +1,3 @@
-import importlib
 import os
 import subprocess
 import sys
@@ -10,19 +9,39 @@ REQUIRED_PACKAGES = {
     "docx": "python-docx",
 }
 
+try:
+    from importlib.util import find_spec
+except ImportError:
+    # A third-party "importlib" package can shadow the standard library module,
+    # leaving ``importlib.util`` unavailable.
+    find_spec = None
+
+
+def _is_installed(module: str) -> bool:
+    """Return whether *module* can be imported, without importing it if possible."""
+    if find_spec is not None:
+        return find_spec(module) is not None
+    try:
+        __import__(module)
+    except ModuleNotFoundError:
+        return False
+    return True
+
+
 def ensure_packages() -> None:
-    """Install required packages if they are missing."""
-    for module, package in REQUIRED_PACKAGES.items():
-        try:
-            try:
-                __import__(module)
-            except ModuleNotFoundError:
-                subprocess.check_call([sys.executable, "-m", "pip", "install", package])
-        except AttributeError:
-            # A third-party "importlib" package can shadow the standard library module,
-            # leaving ``importlib.util`` unavailable.
-            if importlib.util.find_spec(module) is None:
-                subprocess.check_call([sys.executable, "-m", "pip", "install", package])
+    """Install required packages if they are missing.
+
+    Presence is checked with ``find_spec`` so that PyQt6 and the Google
+    client are not fully imported just to find out they exist.  Missing
+    packages are installed by a single pip run.
+    """
+    missing = [
+        package
+        for module, package in REQUIRED_PACKAGES.items()
+        if not _is_installed(module)
+    ]
+    if missing:
+        subprocess.check_call([sys.executable, "-m", "pip", "install", *missing])
 
 
 def configure_qt_platform() -> None: